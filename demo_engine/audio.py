@@ -9,9 +9,16 @@ Manages:
 
 from __future__ import annotations
 
+import json
+import math
+import os
 import shutil
 import subprocess
+import tempfile
+import wave
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -63,33 +70,57 @@ SFX_MAP = {
 }
 
 
+@lru_cache(maxsize=1)
+def _audio_index() -> dict[str, Path]:
+    """Index the audio assets directory once: file name → path.
+
+    Call ``_audio_index.cache_clear()`` after adding or removing assets.
+    """
+    if not SOUNDTRACK_DIR.exists():
+        return {}
+    return {
+        p.name: p
+        for p in sorted(SOUNDTRACK_DIR.iterdir())
+        if p.is_file()
+    }
+
+
 def find_soundtrack(name: str) -> Optional[AudioTrack]:
     """Find a soundtrack by name in the assets directory."""
+    index = _audio_index()
+
     # Try exact match
     for ext in (".mp3", ".wav", ".ogg"):
-        path = SOUNDTRACK_DIR / f"{name}{ext}"
-        if path.exists():
+        path = index.get(f"{name}{ext}")
+        if path is not None:
             return AudioTrack(path=path, label=name, loop=True)
 
     # Try partial match
-    if SOUNDTRACK_DIR.exists():
-        for f in SOUNDTRACK_DIR.iterdir():
-            if name.lower() in f.stem.lower():
-                return AudioTrack(path=f, label=f.stem, loop=True)
+    name_lower = name.lower()
+    for path in index.values():
+        if name_lower in path.stem.lower():
+            return AudioTrack(path=path, label=path.stem, loop=True)
 
     return None
 
 
 def find_sfx(name: str) -> Optional[Path]:
     """Find a sound effect file by name."""
+    index = _audio_index()
+
     if name in SFX_MAP:
-        path = SOUNDTRACK_DIR / SFX_MAP[name]
-        if path.exists():
+        path = index.get(SFX_MAP[name])
+        if path is not None:
             return path
 
     # Direct file check
+    path = index.get(name)
+    if path is not None:
+        return path
+
+    # Nested paths aren't indexed
     path = SOUNDTRACK_DIR / name
-    if path.exists():
+    if path.parent != SOUNDTRACK_DIR and path.exists():
         return path
 
     return None
@@ -97,8 +128,131 @@ def find_sfx(name: str) -> Optional[Path]:
 
 # ── Audio mixing ──────────────────────────────────────────────────────────
 
+# Target length of each parallel decode segment (seconds)
+SEGMENT_S = 10.0
+
+# Output sample rate of every re-encoded mix, so single-job and segmented
+# mixes match and segments concatenate sample-exactly
+SEGMENT_RATE = 48000
+
+
+# Resolved once per process; reused as argv[0] to skip PATH searches
+_FFMPEG_PATH = shutil.which("ffmpeg")
+_FFPROBE_PATH = shutil.which("ffprobe")
+
+# Keep ffmpeg from writing banner and progress output nobody reads
+_QUIET = ("-hide_banner", "-nostats", "-loglevel", "error")
+
+
 def _check_ffmpeg() -> bool:
-    return shutil.which("ffmpeg") is not None
+    return _FFMPEG_PATH is not None
+
+
+def _run_ffmpeg(
+    cmd: list[str], timeout: float = 60, stdin_text: Optional[str] = None
+) -> bool:
+    """Run an ffmpeg command. Returns True on a zero exit status.
+
+    Output is discarded rather than buffered and decoded, since only the
+    exit status is used.
+    """
+    try:
+        proc = subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE if stdin_text is not None else subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+    except FileNotFoundError:
+        return False
+
+    try:
+        proc.communicate(
+            stdin_text.encode("utf-8") if stdin_text is not None else None,
+            timeout=timeout,
+        )
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+        return False
+    return proc.returncode == 0
+
+
+@lru_cache(maxsize=32)
+def _probe_audio(path: str, mtime_ns: int) -> Optional[tuple[str, float]]:
+    """Return (codec_name, duration_s) of the first audio stream via ffprobe.
+
+    ``mtime_ns`` is only part of the cache key so edited files are re-probed.
+    """
+    if _FFPROBE_PATH is None:
+        return None
+    cmd = [
+        _FFPROBE_PATH, "-v", "error",
+        "-select_streams", "a:0",
+        "-show_entries", "stream=codec_name:format=duration",
+        "-of", "json",
+        path,
+    ]
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
+        info = json.loads(result.stdout)
+        codec = info["streams"][0]["codec_name"]
+        duration = float(info["format"]["duration"])
+    except (subprocess.TimeoutExpired, FileNotFoundError, ValueError, KeyError, IndexError):
+        return None
+    return codec, duration
+
+
+def _copy_cmd(
+    src: Path, output: Path, duration_s: float, src_duration_s: float
+) -> list[str]:
+    """Build a stream-copy command, trimming at the container level if needed."""
+    cmd = [_FFMPEG_PATH, "-y", *_QUIET, "-i", str(src)]
+    if src_duration_s - duration_s > 0.05:
+        cmd.extend(["-t", str(duration_s)])
+    cmd.extend(["-c", "copy", str(output)])
+    return cmd
+
+
+# AAC encoders in order of preference: AudioToolbox, Fraunhofer, native
+AAC_ENCODERS = ("aac_at", "libfdk_aac", "aac")
+
+
+@lru_cache(maxsize=1)
+def _best_aac_encoder() -> str:
+    """Pick the fastest AAC encoder compiled into the local ffmpeg."""
+    try:
+        result = subprocess.run(
+            [_FFMPEG_PATH, "-hide_banner", "-encoders"],
+            capture_output=True, text=True, timeout=10,
+        )
+    except (subprocess.TimeoutExpired, FileNotFoundError, TypeError):
+        return "aac"
+
+    # Encoder lines look like: " A....D aac_at   AAC (AudioToolbox) ..."
+    available = {
+        parts[1]
+        for parts in (line.split() for line in result.stdout.splitlines())
+        if len(parts) >= 2 and parts[0].startswith("A")
+    }
+    for name in AAC_ENCODERS:
+        if name in available:
+            return name
+    return "aac"
+
+
+def _encode_cmd(src: Path, output: Path, length_s: float) -> list[str]:
+    """Build the trim + AAC encode command for the soundtrack."""
+    return [
+        _FFMPEG_PATH, "-y", *_QUIET,
+        "-i", str(src),
+        "-t", str(length_s),
+        "-ar", str(SEGMENT_RATE),
+        "-ac", "2",
+        "-c:a", _best_aac_encoder(),
+        "-b:a", "192k",
+        str(output),
+    ]
 
 
 def mix_audio(
@@ -111,6 +265,11 @@ def mix_audio(
     This is a simplified mixer — for complex mixes, consider
     using a dedicated audio library.
 
+    Soundtracks that are already AAC are stream-copied (and trimmed at
+    the container level) without re-encoding. Otherwise long soundtracks
+    are split into ~SEGMENT_S second spans that are decoded to PCM by
+    concurrent ffmpeg jobs, then joined and AAC-encoded in a single pass.
+
     Returns output path or None if mixing isn't possible.
     """
     if not audio_mix.enabled or not audio_mix.soundtrack:
@@ -124,26 +283,107 @@ def mix_audio(
 
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
+    src = audio_mix.soundtrack.path
+
+    probe = _probe_audio(str(src), src.stat().st_mtime_ns)
+    workers = min(os.cpu_count() or 1, math.ceil(duration_s / SEGMENT_S))
+    if probe is not None and probe[0] == "aac":
+        # Fast path: source codec already matches the target
+        ok = _run_ffmpeg(_copy_cmd(src, output_path, duration_s, probe[1]))
+    elif workers <= 1:
+        # Simple approach: trim soundtrack to duration in one job
+        ok = _run_ffmpeg(_encode_cmd(src, output_path, duration_s))
+    else:
+        ok = _mix_segmented(src, duration_s, output_path, workers)
+
+    if ok and output_path.exists():
+        audio_mix.output_path = output_path
+        return output_path
 
-    # Simple approach: trim/loop soundtrack to duration
-    cmd = [
-        "ffmpeg", "-y",
-        "-i", str(audio_mix.soundtrack.path),
-        "-t", str(duration_s),
-        "-c:a", "aac",
-        "-b:a", "192k",
-        str(output_path),
+    return None
+
+
+def _segment_cmd(src: Path, output: Path, start: int, end: int) -> list[str]:
+    """Build the command decoding samples ``start:end`` of src to PCM WAV.
+
+    The input is seeked to the segment so each job only decodes its own
+    span; the trim then cuts it to an exact sample count.
+    """
+    return [
+        _FFMPEG_PATH, "-y", *_QUIET,
+        "-ss", str(start / SEGMENT_RATE),
+        "-t", str((end - start) / SEGMENT_RATE),
+        "-i", str(src),
+        "-af", (
+            f"aresample={SEGMENT_RATE},"
+            f"atrim=end_sample={end - start},"
+            "asetpts=PTS-STARTPTS"
+        ),
+        "-ac", "2",
+        "-c:a", "pcm_s16le",
+        str(output),
     ]
 
-    try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
-        if result.returncode == 0 and output_path.exists():
-            audio_mix.output_path = output_path
-            return output_path
-    except (subprocess.TimeoutExpired, FileNotFoundError):
-        pass
 
-    return None
+def _mix_segmented(
+    src: Path, duration_s: float, output_path: Path, workers: int
+) -> bool:
+    """Decode the soundtrack in parallel PCM segments, then encode once.
+
+    Segments are cut on exact sample boundaries and stay uncompressed, so
+    the joined stream has no per-segment AAC priming or padding; the one
+    AAC encode happens over the concatenated PCM.
+    """
+    total = round(duration_s * SEGMENT_RATE)
+    bounds = [total * i // workers for i in range(workers + 1)]
+
+    with tempfile.TemporaryDirectory(prefix="demo-audio-") as tmpdir:
+        tmpdir = Path(tmpdir)
+        segments = [tmpdir / f"seg_{i:03d}.wav" for i in range(workers)]
+        cmds = [
+            _segment_cmd(src, seg, bounds[i], bounds[i + 1])
+            for i, seg in enumerate(segments)
+        ]
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_run_ffmpeg, cmds))
+
+        if not all(results):
+            return False
+
+        # Segments past the end of a short source come back empty; only a
+        # trailing run of them is dropped, a gap mid-track is a failure
+        lengths = [_wav_frames(seg) for seg in segments]
+        count = next((i for i, n in enumerate(lengths) if not n), len(segments))
+        if count == 0 or any(lengths[count:]):
+            return False
+        decoded = segments[:count]
+
+        # The concat list is piped over stdin rather than written to disk;
+        # entries need an explicit file: scheme or they resolve against pipe:
+        concat_list = "".join(f"file 'file:{seg}'\n" for seg in decoded)
+        return _run_ffmpeg(
+            [
+                _FFMPEG_PATH, "-y", *_QUIET,
+                "-f", "concat",
+                "-safe", "0",
+                "-protocol_whitelist", "file,pipe",
+                "-i", "pipe:0",
+                "-c:a", _best_aac_encoder(),
+                "-b:a", "192k",
+                str(output_path),
+            ],
+            stdin_text=concat_list,
+        )
+
+
+def _wav_frames(path: Path) -> int:
+    """Number of sample frames in a WAV file, or 0 if it can't be read."""
+    try:
+        with wave.open(str(path), "rb") as wav:
+            return wav.getnframes()
+    except (OSError, EOFError, wave.Error):
+        return 0
 
 
 def prepare_audio(
@@ -154,14 +394,15 @@ def prepare_audio(
 ) -> Optional[Path]:
     """Prepare audio for a render if enabled.
 
-    Returns path to mixed audio file, or None.
+    Returns path to mixed audio file, or None. Renders with no duration
+    return None before any soundtrack lookup, since there is nothing to mix.
     """
-    if not config_audio:
+    if not config_audio or duration_s <= 0:
         return None
 
     # Try to find a theme-matching soundtrack
     soundtrack = find_soundtrack(theme_name)
-    if not soundtrack:
+    if not soundtrack and theme_name != "synthwave_loop":
         soundtrack = find_soundtrack("synthwave_loop")
 
     if not soundtrack:
@@ -11,10 +11,16 @@ Asciicast v2 format:
 
 from __future__ import annotations
 
-import json
+import math
 from pathlib import Path
 from typing import Optional
 
+try:
+    # Optional C decoder; parses bytes directly without a str round-trip
+    from orjson import loads as _loads
+except ImportError:  # pragma: no cover - depends on installed extras
+    from json import loads as _loads
+
 from demo_engine.terminal_parser import TerminalParser, AnsiMode
 from demo_engine.timeline import (
     EventType,
@@ -24,50 +30,133 @@ from demo_engine.timeline import (
 )
 
 
+# Event lines decoded per bulk JSON call while streaming a cast file
+PARSE_BATCH_LINES = 4096
+
+
+def _decode_batch(
+    batch: list[bytes], events: list[tuple[float, str, str]]
+) -> None:
+    """Decode a batch of raw event lines and append valid events."""
+    try:
+        # Fast path: parse the whole batch in a single decoder call
+        entries = _loads(b"[" + b",".join(batch) + b"]")
+    except ValueError:
+        # A malformed line poisons the bulk parse; fall back to per-line
+        entries = []
+        for raw in batch:
+            try:
+                entries.append(_loads(raw))
+            except ValueError:
+                continue
+
+    for entry in entries:
+        if isinstance(entry, list) and len(entry) >= 3:
+            try:
+                events.append((float(entry[0]), str(entry[1]), str(entry[2])))
+            except (TypeError, ValueError):
+                continue
+
+
 def parse_asciicast(path: str | Path) -> tuple[dict, list[tuple[float, str, str]]]:
     """Parse an asciicast v2 file.
 
+    The file is streamed in binary mode, so only one batch of raw lines
+    is held in memory alongside the parsed events.
+
     Returns:
         (header_dict, list of (timestamp_s, event_type, data))
     """
     path = Path(path)
-    lines = path.read_text().strip().split("\n")
 
-    if not lines:
-        raise ValueError(f"Empty asciicast file: {path}")
+    with path.open("rb") as f:
+        first = b""
+        for raw in f:
+            if raw.strip():
+                first = raw
+                break
 
-    header = json.loads(lines[0])
-    if header.get("version") != 2:
-        raise ValueError(
-            f"Unsupported asciicast version: {header.get('version')} (expected 2)"
-        )
+        if not first:
+            raise ValueError(f"Empty asciicast file: {path}")
 
-    events = []
-    for line in lines[1:]:
-        if not line.strip():
-            continue
-        try:
-            entry = json.loads(line)
-            if isinstance(entry, list) and len(entry) >= 3:
-                ts, etype, data = entry[0], entry[1], entry[2]
-                events.append((float(ts), str(etype), str(data)))
-        except (json.JSONDecodeError, ValueError):
-            continue
+        header = _loads(first)
+        if header.get("version") != 2:
+            raise ValueError(
+                f"Unsupported asciicast version: {header.get('version')} (expected 2)"
+            )
+
+        events: list[tuple[float, str, str]] = []
+        batch: list[bytes] = []
+        for raw in f:
+            if not raw.strip():
+                continue
+            batch.append(raw)
+            if len(batch) >= PARSE_BATCH_LINES:
+                _decode_batch(batch, events)
+                batch.clear()
+        if batch:
+            _decode_batch(batch, events)
 
     return header, events
 
 
+def _first_frame_showing(t_ms: float, frame_ms: float) -> int:
+    """Index of the first frame whose time ``index * frame_ms`` is >= t_ms."""
+    frame = math.ceil(t_ms / frame_ms)
+    # Guard against the division rounding up past an exact frame time
+    if frame > 0 and (frame - 1) * frame_ms >= t_ms:
+        frame -= 1
+    return frame
+
+
+def _emit_snapshot(
+    timeline: Timeline,
+    parser: TerminalParser,
+    data: str,
+    t_ms: float,
+) -> None:
+    """Feed buffered output to the parser and record the resulting screen."""
+    parser.feed(data)
+
+    # Snapshot the terminal state after this output
+    snapshot = parser.snapshot(t_ms=t_ms)
+
+    # Create a line event for each non-empty visible line
+    # We emit the full screen state as a single snapshot event
+    visible_text = snapshot.nonempty_text
+    if visible_text:
+        timeline.add(
+            TimelineEvent(
+                t_ms=t_ms,
+                event_type=EventType.LINE,
+                text=visible_text,
+                style=LineStyle.DEFAULT,
+                meta={
+                    "source": "asciicast",
+                    "cursor": (snapshot.cursor_row, snapshot.cursor_col),
+                },
+            )
+        )
+
+
 def asciicast_to_timeline(
     path: str | Path,
     speed: float = 1.0,
     max_idle_ms: float = 2000.0,
+    fps: int = 30,
 ) -> Timeline:
     """Convert an asciicast recording to a timeline.
 
+    Output events that first become visible on the same rendered frame
+    (the renderer shows every event with ``t_ms <= frame time``) are fed
+    to the terminal parser together and snapshotted once, at the time of
+    the last of them, since no frame could show the intermediate screens.
+
     Args:
         path: Path to .cast file.
         speed: Playback speed multiplier.
         max_idle_ms: Cap idle gaps to prevent long pauses.
+        fps: Target frame rate used to coalesce bursty output.
 
     Returns:
         Timeline with events from the recording.
@@ -79,9 +168,15 @@ def asciicast_to_timeline(
     timeline = Timeline()
     parser = TerminalParser(rows=height, cols=width, ansi_mode=AnsiMode.PRESERVE)
 
+    frame_ms = 1000.0 / fps
     prev_ts = 0.0
     cursor_ms = 0.0
 
+    # Output buffered for the frame that will first show it
+    pending: list[str] = []
+    pending_frame = -1
+    last_ms = 0.0
+
     for ts, etype, data in events:
         if etype != "o":  # Only process output events
             continue
@@ -94,30 +189,17 @@ def asciicast_to_timeline(
         cursor_ms += delta_ms
         prev_ts = ts
 
-        # Feed data to terminal parser
-        parser.feed(data)
+        frame = _first_frame_showing(cursor_ms, frame_ms)
+        if pending and frame != pending_frame:
+            _emit_snapshot(timeline, parser, "".join(pending), last_ms)
+            pending.clear()
 
-        # Snapshot the terminal state after this output
-        snapshot = parser.snapshot(t_ms=cursor_ms)
+        pending.append(data)
+        pending_frame = frame
+        last_ms = cursor_ms
 
-        # Create a line event for each non-empty visible line
-        # We emit the full screen state as a single snapshot event
-        visible_text = "\n".join(
-            line for line in snapshot.lines if line.strip()
-        )
-        if visible_text.strip():
-            timeline.add(
-                TimelineEvent(
-                    t_ms=cursor_ms,
-                    event_type=EventType.LINE,
-                    text=visible_text,
-                    style=LineStyle.DEFAULT,
-                    meta={
-                        "source": "asciicast",
-                        "cursor": (snapshot.cursor_row, snapshot.cursor_col),
-                    },
-                )
-            )
+    if pending:
+        _emit_snapshot(timeline, parser, "".join(pending), last_ms)
 
     timeline.sort()
     return timeline
@@ -10,12 +10,15 @@ from __future__ import annotations
 import argparse
 import sys
 import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from demo_engine import __version__
-from demo_engine.config import RenderConfig
+from demo_engine.audio import prepare_audio
+from demo_engine.config import CACHE_DIR, DEFAULT_OUTDIR, RenderConfig
 from demo_engine.export import export_all, generate_output_name
-from demo_engine.fonts import audit_glyphs, resolve_font_stack
+from demo_engine.fonts import audit_glyphs_cached, resolve_font_stack
 from demo_engine.presets import list_presets
 from demo_engine.renderer import FrameRenderer
 from demo_engine.scenes import (
@@ -48,12 +51,12 @@ def build_parser() -> argparse.ArgumentParser:
     parser.add_argument(
         "--theme",
         default="synthwave",
-        help=f"Visual theme ({', '.join(list_themes())})",
+        help="Visual theme (see --list-themes)",
     )
     parser.add_argument(
         "--scenario",
         default=None,
-        help=f"Scene scenario name or YAML path ({', '.join(list_scenes())})",
+        help="Scene scenario name or YAML path (see --list-scenes)",
     )
 
     # Timing
@@ -110,6 +113,17 @@ def build_parser() -> argparse.ArgumentParser:
         default=None,
         help="Social media cut duration: 8s, 15s, 30s, 45s",
     )
+    parser.add_argument(
+        "--gif-encoder",
+        choices=["auto", "pillow", "gifski", "ffmpeg"],
+        default="auto",
+        help="GIF encoder (default: auto — gifski if installed, else Pillow)",
+    )
+    parser.add_argument(
+        "--no-hw-accel",
+        action="store_true",
+        help="Always use the software H.264 encoder (libx264) for MP4",
+    )
 
     # Audio
     parser.add_argument(
@@ -127,6 +141,13 @@ def build_parser() -> argparse.ArgumentParser:
         help="Random seed for deterministic output",
     )
 
+    # Caching
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Don't read or write the result cache ({CACHE_DIR})",
+    )
+
     # Workspace
     parser.add_argument(
         "--keep-workspace",
@@ -176,8 +197,6 @@ def run(args: argparse.Namespace) -> int:
         return 0
 
     # Build config
-    from demo_engine.config import DEFAULT_OUTDIR
-
     config = RenderConfig(
         theme=args.theme,
         preset=args.preset,
@@ -190,8 +209,11 @@ def run(args: argparse.Namespace) -> int:
         outdir=args.outdir or DEFAULT_OUTDIR,
         cover=args.cover,
         cut=args.cut,
+        gif_encoder=args.gif_encoder,
+        hw_accel=not args.no_hw_accel,
         speed=args.speed,
         audio=args.audio == "on",
+        use_cache=not args.no_cache,
         keep_workspace=args.keep_workspace,
     )
 
@@ -225,8 +247,10 @@ def run(args: argparse.Namespace) -> int:
         print(f"  events: {len(timeline)}, duration: {timeline.duration_ms / 1000:.1f}s")
 
         # Glyph audit
-        all_text = "\n".join(e.text for e in timeline.events if e.text)
-        audit = audit_glyphs(all_text, font_stack, theme.glyph_map)
+        audit = audit_glyphs_cached(
+            timeline.charset, font_stack, theme.glyph_map,
+            cache_dir=CACHE_DIR if config.use_cache else None,
+        )
         print(f"▸ Glyph audit: {audit.coverage_pct:.1f}% coverage "
               f"({audit.covered}/{audit.total_chars} chars)")
         if audit.missing:
@@ -243,8 +267,7 @@ def run(args: argparse.Namespace) -> int:
         if args.dry_run:
             print("\n▸ Dry run — timeline preview:")
             for event in timeline.events[:30]:
-                d = event.to_dict()
-                print(f"  [{d['t_ms']:8.0f}ms] {d['type']:16s} {d['text'][:60]}")
+                print(f"  [{event.t_ms:8.0f}ms] {event.event_type.value:16s} {event.text[:60]}")
             if len(timeline) > 30:
                 print(f"  ... and {len(timeline) - 30} more events")
             return 0
@@ -253,23 +276,30 @@ def run(args: argparse.Namespace) -> int:
         print(f"\n▸ Rendering {len(timeline)} events → {config.resolution[0]}x{config.resolution[1]} frames")
         t0 = time.monotonic()
         renderer = FrameRenderer(config, theme, font_stack)
-        frames = renderer.render_all(timeline)
-        render_time = time.monotonic() - t0
-        print(f"  rendered {len(frames)} frames in {render_time:.1f}s "
-              f"({len(frames) / render_time:.0f} fps)")
-
-        # Export
-        print(f"\n▸ Exporting: {config.export} → {config.outdir}")
-        t0 = time.monotonic()
-
-        # Handle audio
-        audio_path = None
-        if config.audio:
-            from demo_engine.audio import prepare_audio
 
-            audio_path = prepare_audio(
-                True, config.theme, len(frames) / config.fps, config.outdir
-            )
+        # Audio only needs the frame count, so mix it while frames render
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            audio_future = None
+            if config.audio:
+                audio_future = pool.submit(
+                    prepare_audio,
+                    True,
+                    config.theme,
+                    renderer.frame_count(timeline) / config.fps,
+                    config.outdir,
+                )
+
+            frames = renderer.render_all(timeline)
+            render_time = time.monotonic() - t0
+            print(f"  rendered {len(frames)} frames in {render_time:.1f}s "
+                  f"({len(frames) / render_time:.0f} fps)")
+
+            # Export
+            print(f"\n▸ Exporting: {config.export} → {config.outdir}")
+            t0 = time.monotonic()
+
+            # Handle audio
+            audio_path = audio_future.result() if audio_future else None
             if audio_path:
                 print(f"  audio: {audio_path}")
 
@@ -283,7 +313,6 @@ def run(args: argparse.Namespace) -> int:
 
     except Exception as e:
         print(f"\n✗ Error: {e}", file=sys.stderr)
-        import traceback
         traceback.print_exc()
         return 1
 
@@ -6,8 +6,10 @@ import os
 import random
 import tempfile
 from dataclasses import dataclass, field
+from functools import cached_property
 from pathlib import Path
-from typing import Optional
+from types import MappingProxyType
+from typing import Final, Mapping, Optional
 
 
 # Resolve project root relative to this file
@@ -17,6 +19,18 @@ SCENES_DIR = PROJECT_ROOT / "scenes"
 ASSETS_DIR = PROJECT_ROOT / "assets"
 DEFAULT_OUTDIR = PROJECT_ROOT
 
+# Persistent cache for results that survive across runs
+CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "demo-engine"
+)
+
+# Canvas resolution per aspect ratio
+ASPECT_RESOLUTIONS: Final[Mapping[str, tuple[int, int]]] = MappingProxyType({
+    "16:9": (1920, 1080),
+    "1:1": (1080, 1080),
+    "9:16": (1080, 1920),
+})
+
 
 @dataclass
 class RenderConfig:
@@ -35,9 +49,11 @@ class RenderConfig:
 
     # Export
     export: str = "gif"  # gif | mp4 | webm | all
+    gif_encoder: str = "auto"  # auto | pillow | gifski | ffmpeg
     outdir: Path = field(default_factory=lambda: DEFAULT_OUTDIR)
     cover: str = "auto"  # auto | frame:<idx> | none
     cut: Optional[str] = None  # 8s | 15s | 30s | 45s
+    hw_accel: bool = True  # Prefer hardware video encoders
 
     # Timing
     speed: float = 1.0
@@ -45,6 +61,9 @@ class RenderConfig:
     # Audio
     audio: bool = False
 
+    # Caching
+    use_cache: bool = True
+
     # Workspace
     keep_workspace: bool = False
     workspace: Optional[Path] = None
@@ -53,6 +72,11 @@ class RenderConfig:
     rng: random.Random = field(default_factory=random.Random, repr=False)
 
     def __post_init__(self) -> None:
+        if self.aspect not in ASPECT_RESOLUTIONS:
+            raise ValueError(
+                f"Unknown aspect ratio: {self.aspect!r} "
+                f"(expected one of {', '.join(ASPECT_RESOLUTIONS)})"
+            )
         self.outdir = Path(self.outdir)
         if self.seed is not None:
             self.rng = random.Random(self.seed)
@@ -61,22 +85,17 @@ class RenderConfig:
                 tempfile.mkdtemp(prefix=f"demo-{self.theme}-")
             )
 
-    @property
+    @cached_property
     def fps(self) -> int:
         """Frames per second based on preset."""
         from demo_engine.presets import get_preset
 
         return get_preset(self.preset).fps
 
-    @property
+    @cached_property
     def resolution(self) -> tuple[int, int]:
         """Canvas resolution based on aspect ratio."""
-        aspect_map = {
-            "16:9": (1920, 1080),
-            "1:1": (1080, 1080),
-            "9:16": (1080, 1920),
-        }
-        return aspect_map.get(self.aspect, (1920, 1080))
+        return ASPECT_RESOLUTIONS[self.aspect]
 
     def cleanup(self) -> None:
         """Remove workspace if not keeping."""
@@ -15,8 +15,11 @@ from __future__ import annotations
 import math
 import random
 from dataclasses import dataclass
+from functools import lru_cache
+from statistics import NormalDist
+from typing import Optional
 
-from PIL import Image, ImageDraw, ImageEnhance, ImageFilter
+from PIL import Image, ImageChops, ImageDraw, ImageEnhance, ImageFilter
 
 
 @dataclass
@@ -68,20 +71,30 @@ def apply_effects(
     ]):
         return img
 
-    result = img.copy()
+    # Every effect returns a new image, so the input never needs copying
+    result = img
 
     # 1. Text glow (applied as a gentle bloom)
     if config.glow_strength > 0:
         result = _apply_glow(result, config.scaled("glow_strength"))
 
     # 2. CRT scanlines
-    if config.crt or config.scanline_alpha > 0:
-        alpha = config.scaled("scanline_alpha") if config.scanline_alpha > 0 else 0.1
-        result = _apply_scanlines(result, alpha)
+    scanlines = config.crt or config.scanline_alpha > 0
+    scan_alpha = config.scaled("scanline_alpha") if config.scanline_alpha > 0 else 0.1
+    vignette = config.scaled("vignette_strength")
+
+    if scanlines and vignette > 0:
+        # Both only darken, so fold 2 and 3 into a single multiply pass
+        result = ImageChops.multiply(
+            result, _shading_mask(result.size, scan_alpha, vignette)
+        )
+    else:
+        if scanlines:
+            result = _apply_scanlines(result, scan_alpha)
 
-    # 3. Vignette
-    if config.vignette_strength > 0:
-        result = _apply_vignette(result, config.scaled("vignette_strength"))
+        # 3. Vignette
+        if vignette > 0:
+            result = _apply_vignette(result, vignette)
 
     # 4. Noise/grain
     if config.noise_alpha > 0:
@@ -93,47 +106,69 @@ def apply_effects(
             result, config.scaled("chromatic_aberration")
         )
 
-    # 6. Glitch cuts (periodic)
-    if config.glitch_cuts:
-        result = _apply_glitch(result, t_ms, frame_num)
+    # 6. Glitch cuts (periodic: every ~2s, for ~3 frames). The gate is
+    # checked here so the common no-glitch frame skips the call entirely.
+    if config.glitch_cuts and int(t_ms / 2000) % 10 == 0 and frame_num % 8 <= 2:
+        result = _apply_glitch(result, frame_num)
 
     return result
 
 
 # ── Individual effect implementations ─────────────────────────────────────
 
+# Glow is blurred at 1/N resolution (the blur radius shrinks with it)
+GLOW_DOWNSCALE = 4
+
+
 def _apply_glow(img: Image.Image, strength: float) -> Image.Image:
     """Apply a soft bloom/glow effect to bright areas."""
     if strength <= 0:
         return img
 
-    # Create a brightened, blurred version
-    enhancer = ImageEnhance.Brightness(img)
-    bright = enhancer.enhance(1.0 + strength * 0.3)
-    blurred = bright.filter(ImageFilter.GaussianBlur(radius=int(3 + strength * 5)))
+    # The bloom is low-frequency, so brighten and blur a downscaled copy
+    # and scale the result back up instead of blurring at full resolution
+    radius = int(3 + strength * 5)
+    small = img.reduce(GLOW_DOWNSCALE)
+    bright = ImageEnhance.Brightness(small).enhance(1.0 + strength * 0.3)
+    blurred = bright.filter(ImageFilter.GaussianBlur(radius=radius / GLOW_DOWNSCALE))
+    blurred = blurred.resize(img.size, Image.Resampling.BILINEAR)
 
     # Blend: screen-like composite
     return Image.blend(img, blurred, alpha=min(strength * 0.3, 0.4))
 
 
 def _apply_scanlines(img: Image.Image, alpha: float) -> Image.Image:
-    """Apply CRT-style horizontal scanlines."""
+    """Apply CRT-style horizontal scanlines.
+
+    Darkening every third row is a per-row multiply, so the frame is
+    multiplied by a cached gain mask rather than alpha-composited with an
+    overlay (which needed an RGBA round-trip).
+    """
     if alpha <= 0:
         return img
 
-    w, h = img.size
-    overlay = Image.new("RGBA", (w, h), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(overlay)
+    return ImageChops.multiply(img, _scanline_gain(img.size, alpha))
+
 
-    # Draw alternating dark lines every 2 pixels
-    line_alpha = int(min(alpha * 255, 80))
-    for y in range(0, h, 3):
-        draw.line([(0, y), (w, y)], fill=(0, 0, 0, line_alpha))
+@lru_cache(maxsize=8)
+def _scanline_gain(size: tuple[int, int], alpha: float) -> Image.Image:
+    """RGB multiply mask that darkens every third row."""
+    w, h = size
+    level = 255 - int(min(alpha * 255, 80))
+    column = bytes(level if y % 3 == 0 else 255 for y in range(h))
+    gain = Image.frombytes("L", (1, h), column)
+    return gain.resize((w, h), Image.Resampling.NEAREST).convert("RGB")
 
-    # Composite
-    result = img.convert("RGBA")
-    result = Image.alpha_composite(result, overlay)
-    return result.convert("RGB")
+
+@lru_cache(maxsize=8)
+def _shading_mask(
+    size: tuple[int, int], scan_alpha: float, vignette_strength: float
+) -> Image.Image:
+    """Combined scanline + vignette mask, so both cost one multiply per frame."""
+    return ImageChops.multiply(
+        _scanline_gain(size, scan_alpha),
+        _vignette_mask(size, vignette_strength),
+    )
 
 
 def _apply_vignette(img: Image.Image, strength: float) -> Image.Image:
@@ -141,33 +176,25 @@ def _apply_vignette(img: Image.Image, strength: float) -> Image.Image:
     if strength <= 0:
         return img
 
-    w, h = img.size
-    vignette = Image.new("L", (w, h), 255)
-    draw = ImageDraw.Draw(vignette)
-
-    # Radial gradient: bright center, dark edges
-    cx, cy = w // 2, h // 2
-    max_r = math.sqrt(cx * cx + cy * cy)
-
-    # Use concentric ellipses for a smooth gradient
-    steps = 40
-    for i in range(steps, 0, -1):
-        frac = i / steps
-        brightness = int(255 * (1.0 - strength * (1.0 - frac) ** 1.5))
-        rx = int(cx * frac * 1.4)
-        ry = int(cy * frac * 1.4)
-        draw.ellipse(
-            (cx - rx, cy - ry, cx + rx, cy + ry),
-            fill=brightness,
-        )
-
     # Apply as a multiply
-    result = img.copy()
-    r, g, b = result.split()
-    r = Image.composite(r, Image.new("L", (w, h), 0), vignette)
-    g = Image.composite(g, Image.new("L", (w, h), 0), vignette)
-    b = Image.composite(b, Image.new("L", (w, h), 0), vignette)
-    return Image.merge("RGB", (r, g, b))
+    return ImageChops.multiply(img, _vignette_mask(img.size, strength))
+
+
+@lru_cache(maxsize=8)
+def _vignette_mask(size: tuple[int, int], strength: float) -> Image.Image:
+    """Build the RGB multiply mask for a vignette of the given size.
+
+    Pillow's radial gradient encodes the elliptical distance from the
+    centre (255 at the corners); a lookup table maps it to brightness so
+    the whole mask is built in C once per size and strength.
+    """
+    lut = []
+    for v in range(256):
+        frac = max(0.0, 1.0 - (v / 255) / 1.4)
+        lut.append(int(255 * (1.0 - strength * (1.0 - frac) ** 1.5)))
+
+    gradient = Image.radial_gradient("L").resize(size, Image.Resampling.BILINEAR)
+    return gradient.point(lut).convert("RGB")
 
 
 def _apply_noise(
@@ -180,16 +207,24 @@ def _apply_noise(
     w, h = img.size
     rng = random.Random(seed)
 
-    # Generate noise
-    noise_data = bytes(
-        max(0, min(255, 128 + int(rng.gauss(0, alpha * 80))))
-        for _ in range(w * h)
-    )
-    noise = Image.frombytes("L", (w, h), noise_data)
+    # Uniform random bytes are mapped through a Gaussian inverse-CDF table,
+    # so the per-pixel work happens in C rather than one gauss() per pixel
+    noise = Image.frombytes("L", (w, h), rng.randbytes(w * h))
+    noise = noise.point(_gaussian_noise_lut(alpha * 80))
 
     # Blend noise with the image
-    noise_rgb = Image.merge("RGB", (noise, noise, noise))
-    return Image.blend(img, noise_rgb, alpha=min(alpha * 0.15, 0.12))
+    return Image.blend(img, noise.convert("RGB"), alpha=min(alpha * 0.15, 0.12))
+
+
+@lru_cache(maxsize=8)
+def _gaussian_noise_lut(sigma: float) -> list[int]:
+    """Map uniform byte values to Gaussian grain centred on 128."""
+    dist = NormalDist(0.0, sigma) if sigma > 0 else None
+    lut = []
+    for i in range(256):
+        offset = dist.inv_cdf((i + 0.5) / 256) if dist else 0.0
+        lut.append(max(0, min(255, 128 + int(offset))))
+    return lut
 
 
 def _apply_chromatic_aberration(
@@ -203,34 +238,42 @@ def _apply_chromatic_aberration(
     r, g, b = img.split()
 
     # Offset red and blue channels slightly
-    from PIL import ImageChops
+    return Image.merge("RGB", (_roll_x(r, offset), g, _roll_x(b, -offset)))
 
-    r_shifted = ImageChops.offset(r, offset, 0)
-    b_shifted = ImageChops.offset(b, -offset, 0)
 
-    return Image.merge("RGB", (r_shifted, g, b_shifted))
+def _roll_x(band: Image.Image, dx: int) -> Image.Image:
+    """Shift a band horizontally with wrap-around.
 
+    Equivalent to ``ImageChops.offset(band, dx, 0)``, but built from two
+    row-contiguous block copies instead of a per-pixel modulo lookup.
+    """
+    w, h = band.size
+    dx %= w
+    if dx == 0:
+        return band
+    out = Image.new(band.mode, band.size)
+    out.paste(band.crop((0, 0, w - dx, h)), (dx, 0))
+    out.paste(band.crop((w - dx, 0, w, h)), (0, 0))
+    return out
 
-def _apply_glitch(
-    img: Image.Image, t_ms: float, frame_num: int
-) -> Image.Image:
-    """Apply periodic glitch effect (horizontal slice displacement)."""
-    # Only glitch occasionally (every ~2s, for ~3 frames)
-    cycle = int(t_ms / 2000) % 10
-    if cycle != 0 or frame_num % 8 > 2:
-        return img
 
+def _apply_glitch(img: Image.Image, frame_num: int) -> Image.Image:
+    """Apply a glitch effect (horizontal slice displacement).
+
+    Only called on glitch frames; ``apply_effects`` does the timing check.
+    """
     w, h = img.size
     result = img.copy()
     rng = random.Random(frame_num)
 
-    # Displace 3–6 random horizontal slices
+    # Displace 3–6 random horizontal slices, drawing all parameters up front
     num_slices = rng.randint(3, 6)
-    for _ in range(num_slices):
-        y = rng.randint(0, h - 20)
-        slice_h = rng.randint(4, 20)
-        offset_x = rng.randint(-30, 30)
+    slices = [
+        (rng.randint(0, h - 20), rng.randint(4, 20), rng.randint(-30, 30))
+        for _ in range(num_slices)
+    ]
 
+    for y, slice_h, offset_x in slices:
         if slice_h + y > h:
             slice_h = h - y
 
@@ -298,6 +341,20 @@ def apply_transition(
 
 # ── Story enhancement components ──────────────────────────────────────────
 
+# Telemetry status → (theme color key, fallback color)
+STATUS_COLOR_KEYS = {
+    "ok": ("success", "#86efac"),
+    "warn": ("warn", "#fbbf24"),
+    "error": ("error", "#f87171"),
+}
+
+
+@lru_cache(maxsize=256)
+def _text_width(font: ImageFont.FreeTypeFont, text: str) -> int:
+    """Measured advance width of ``text``, cached per font and string."""
+    return int(math.ceil(font.getlength(text)))
+
+
 def draw_telemetry_sidebar(
     draw: ImageDraw.ImageDraw,
     x: int,
@@ -325,20 +382,23 @@ def draw_telemetry_sidebar(
         fill=theme_colors.get("panel", "#141414"),
     )
 
-    # Header
-    draw.text((x + 10, y + 6), "TELEMETRY", fill=theme_colors.get("dim", "#666"), font=font)
-    cy = y + 24
-
+    # Resolve colors once rather than per metric
+    dim = theme_colors.get("dim", "#666")
+    default_color = theme_colors.get("text", "#ccc")
     status_colors = {
-        "ok": theme_colors.get("success", "#86efac"),
-        "warn": theme_colors.get("warn", "#fbbf24"),
-        "error": theme_colors.get("error", "#f87171"),
+        status: theme_colors.get(key, fallback)
+        for status, (key, fallback) in STATUS_COLOR_KEYS.items()
     }
 
+    # Header
+    draw.text((x + 10, y + 6), "TELEMETRY", fill=dim, font=font)
+    cy = y + 24
+
     for label, value, status in metrics:
-        color = status_colors.get(status, theme_colors.get("text", "#ccc"))
-        draw.text((x + 10, cy), f"{label}: ", fill=theme_colors.get("dim", "#666"), font=font)
-        draw.text((x + 10 + len(label) * 8 + 16, cy), value, fill=color, font=font)
+        color = status_colors.get(status, default_color)
+        prefix = f"{label}: "
+        draw.text((x + 10, cy), prefix, fill=dim, font=font)
+        draw.text((x + 10 + _text_width(font, prefix), cy), value, fill=color, font=font)
         cy += line_height
 
     return cy + 10
@@ -372,12 +432,16 @@ def draw_benchmark_card(
         font=font,
     )
 
+    dim = theme_colors.get("dim", "#666")
+    before_color = theme_colors.get("warn", "#fbbf24")
+    after_color = theme_colors.get("success", "#86efac")
+
     cy = y + 34
     for label, before, after in rows:
-        draw.text((x + 12, cy), label, fill=theme_colors.get("dim", "#666"), font=font)
-        draw.text((x + 12 + 140, cy), before, fill=theme_colors.get("warn", "#fbbf24"), font=font)
-        draw.text((x + 12 + 220, cy), "→", fill=theme_colors.get("dim", "#666"), font=font)
-        draw.text((x + 12 + 250, cy), after, fill=theme_colors.get("success", "#86efac"), font=font)
+        draw.text((x + 12, cy), label, fill=dim, font=font)
+        draw.text((x + 12 + 140, cy), before, fill=before_color, font=font)
+        draw.text((x + 12 + 220, cy), "→", fill=dim, font=font)
+        draw.text((x + 12 + 250, cy), after, fill=after_color, font=font)
         cy += 22
 
 
@@ -390,10 +454,11 @@ def draw_outro_card(
     repo: str = "",
     endpoint: str = "",
     tagline: str = "",
-    theme_colors: dict[str, str] = {},
+    theme_colors: Optional[dict[str, str]] = None,
     font: ImageFont.FreeTypeFont = None,
 ) -> None:
     """Draw an outro CTA card."""
+    theme_colors = theme_colors or {}
     draw.rounded_rectangle(
         (x, y, x + width, y + height),
         radius=10,
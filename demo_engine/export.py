@@ -1,22 +1,29 @@
 """Multi-format export pipeline.
 
 Exports rendered frames to:
-  - GIF (Pillow + optional palette optimization)
-  - MP4 (H.264 via ffmpeg)
+  - GIF (Pillow with a shared palette, or gifski / ffmpeg when selected)
+  - MP4 (H.264 via ffmpeg, hardware-encoded when available)
   - WebM (VP9 via ffmpeg)
   - Cover PNG (best frame or specific index)
 
 Supports aspect ratio variants and social cuts.
+
+Exporters accept any frame sequence (a list, tuple, or slice view) and
+only rely on ``len()``, indexing, and iteration, so callers can pass
+frames through without materializing a new list.
 """
 
 from __future__ import annotations
 
+import itertools
 import shutil
 import subprocess
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional, Sequence
 
 from PIL import Image
 
@@ -63,35 +70,90 @@ class ExportManifest:
 
 # ── GIF export ────────────────────────────────────────────────────────────
 
+def _quantize_frame(frame: Image.Image) -> Image.Image:
+    return frame.quantize(colors=256, method=Image.Quantize.MEDIANCUT)
+
+
+# GIF encoders selectable via RenderConfig.gif_encoder
+GIF_ENCODERS = ("auto", "pillow", "gifski", "ffmpeg")
+
+
 def export_gif(
-    frames: list[Image.Image],
+    frames: Sequence[Image.Image],
     output_path: Path,
     fps: int = 30,
     optimize: bool = True,
     loop: int = 0,
+    encoder: str = "auto",
 ) -> ExportResult:
     """Export frames as an optimized GIF.
 
     Args:
-        frames: List of PIL Image frames.
+        frames: Sequence of PIL Image frames.
         output_path: Output .gif path.
         fps: Frames per second.
         optimize: Apply palette optimization.
         loop: Loop count (0 = infinite).
+        encoder: "pillow", "gifski", "ffmpeg", or "auto" (gifski when
+            installed, otherwise Pillow).
     """
     if not frames:
         raise ValueError("No frames to export")
+    if encoder not in GIF_ENCODERS:
+        raise ValueError(
+            f"Unknown GIF encoder: {encoder!r} (expected one of {', '.join(GIF_ENCODERS)})"
+        )
 
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
+    if encoder == "auto":
+        encoder = "gifski" if shutil.which("gifski") else "pillow"
+
+    if encoder == "gifski":
+        if not shutil.which("gifski"):
+            raise RuntimeError("gifski not found — required for gifski GIF export")
+        _gif_gifski(frames, output_path, fps, loop)
+    elif encoder == "ffmpeg":
+        if not _check_ffmpeg():
+            raise RuntimeError("ffmpeg not found — required for ffmpeg GIF export")
+        _encode_video(
+            frames,
+            output_path,
+            fps,
+            [
+                "-vf",
+                "split[a][b];[a]palettegen=stats_mode=diff[p];"
+                "[b][p]paletteuse=dither=bayer",
+                "-loop", str(loop),
+            ],
+        )
+    else:
+        _gif_pillow(frames, output_path, fps, optimize, loop)
+
+    stat = output_path.stat()
+    return ExportResult(
+        format="gif",
+        path=output_path,
+        size_bytes=stat.st_size,
+        duration_s=len(frames) / fps,
+        resolution=frames[0].size,
+    )
+
+
+def _gif_pillow(
+    frames: Sequence[Image.Image],
+    output_path: Path,
+    fps: int,
+    optimize: bool,
+    loop: int,
+) -> None:
+    """Write a GIF with Pillow's encoder."""
     duration_ms = int(1000 / fps)
 
-    # Convert to palette mode for GIF
-    quantized = []
-    for frame in frames:
-        q = frame.quantize(colors=256, method=Image.Quantize.MEDIANCUT)
-        quantized.append(q)
+    # Convert to palette mode for GIF (quantize releases the GIL)
+    with ThreadPoolExecutor() as pool:
+        quantized = list(pool.map(_quantize_frame, frames))
 
     quantized[0].save(
         str(output_path),
@@ -102,14 +164,38 @@ def export_gif(
         optimize=optimize,
     )
 
-    stat = output_path.stat()
-    return ExportResult(
-        format="gif",
-        path=output_path,
-        size_bytes=stat.st_size,
-        duration_s=len(frames) / fps,
-        resolution=frames[0].size,
-    )
+
+def _gif_gifski(
+    frames: Sequence[Image.Image],
+    output_path: Path,
+    fps: int,
+    loop: int,
+    timeout: float = 600,
+) -> None:
+    """Write a GIF with gifski (multithreaded, per-frame palettes)."""
+    with tempfile.TemporaryDirectory(prefix="demo-gifski-") as tmpdir:
+        paths = [Path(tmpdir) / f"{i:06d}.png" for i in range(len(frames))]
+
+        # The PNGs are transient, so favour encode speed over size
+        def save(item: tuple[Image.Image, Path]) -> None:
+            item[0].save(item[1], compress_level=1)
+
+        with ThreadPoolExecutor() as pool:
+            list(pool.map(save, zip(frames, paths)))
+
+        cmd = ["gifski", "--fps", str(fps), "--width", str(frames[0].width)]
+        if loop != 0:
+            # Looping forever is gifski's default; --repeat needs gifski 1.10+
+            cmd.extend(["--repeat", str(loop)])
+        cmd.extend(["-o", str(output_path), *map(str, paths)])
+        try:
+            result = subprocess.run(
+                cmd, capture_output=True, text=True, timeout=timeout
+            )
+        except subprocess.TimeoutExpired:
+            raise RuntimeError(f"gifski timed out after {timeout:.0f}s")
+        if result.returncode != 0:
+            raise RuntimeError(f"gifski failed: {result.stderr[:500]}")
 
 
 # ── Video export (ffmpeg) ─────────────────────────────────────────────────
@@ -119,21 +205,140 @@ def _check_ffmpeg() -> bool:
     return shutil.which("ffmpeg") is not None
 
 
+# Hardware H.264 encoders in order of preference (libx264 is the fallback)
+HW_H264_ENCODERS = ("h264_nvenc", "h264_videotoolbox")
+
+# Encoders compiled into ffmpeg that failed at runtime (e.g. no GPU present)
+_FAILED_ENCODERS: set[str] = set()
+
+
+@lru_cache(maxsize=1)
+def _available_encoders() -> frozenset[str]:
+    """Video encoders compiled into the local ffmpeg."""
+    # Resolved once (the result is cached) so the probe runs the same
+    # binary _check_ffmpeg found
+    ffmpeg = shutil.which("ffmpeg")
+    if ffmpeg is None:
+        return frozenset()
+    try:
+        result = subprocess.run(
+            [ffmpeg, "-hide_banner", "-encoders"],
+            capture_output=True, text=True, timeout=10,
+        )
+    except (subprocess.TimeoutExpired, FileNotFoundError):
+        return frozenset()
+
+    # Encoder lines look like: " V....D libx264   libx264 H.264 ..."
+    return frozenset(
+        parts[1]
+        for parts in (line.split() for line in result.stdout.splitlines())
+        if len(parts) >= 2 and parts[0].startswith("V")
+    )
+
+
+def _h264_args(encoder: str, crf: int) -> list[str]:
+    """Codec arguments for an H.264 encoder at roughly CRF-equivalent quality."""
+    if encoder == "h264_nvenc":
+        quality = ["-rc", "vbr", "-cq", str(crf), "-b:v", "0"]
+    elif encoder == "h264_videotoolbox":
+        # VideoToolbox takes a 1–100 quality scale (higher is better)
+        quality = ["-q:v", str(max(1, min(100, 100 - 2 * crf)))]
+    else:
+        quality = ["-crf", str(crf)]
+
+    return [
+        "-c:v", encoder,
+        *quality,
+        "-pix_fmt", "yuv420p",
+        "-movflags", "+faststart",
+    ]
+
+
+def _encode_video(
+    frames: Sequence[Image.Image],
+    output_path: Path,
+    fps: int,
+    codec_args: list[str],
+    audio_path: Optional[Path] = None,
+    timeout: float = 300,
+) -> None:
+    """Stream frames to ffmpeg as raw RGB over stdin and encode them.
+
+    Frames go straight from memory to the encoder, with no intermediate
+    image files to encode, write, and decode again. Runs of the same frame
+    object (held frames) are converted to bytes once.
+    """
+    w, h = frames[0].size
+    cmd = [
+        "ffmpeg", "-y",
+        "-f", "rawvideo",
+        "-pix_fmt", "rgb24",
+        "-s", f"{w}x{h}",
+        "-framerate", str(fps),
+        "-i", "pipe:0",
+    ]
+
+    if audio_path and audio_path.exists():
+        cmd.extend(["-i", str(audio_path), "-shortest"])
+
+    cmd.extend(codec_args)
+    cmd.append(str(output_path))
+
+    # stderr goes to a file so a chatty encoder can never fill the pipe
+    # and stall while we are still writing frames
+    with tempfile.TemporaryFile() as errlog:
+        proc = subprocess.Popen(
+            cmd, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=errlog
+        )
+        try:
+            last = None
+            data = b""
+            for frame in frames:
+                if frame is not last:
+                    last = frame
+                    if frame.mode != "RGB":
+                        frame = frame.convert("RGB")
+                    data = frame.tobytes()
+                proc.stdin.write(data)
+        except BrokenPipeError:
+            pass  # ffmpeg exited early; its status and log explain why
+        finally:
+            try:
+                proc.stdin.close()
+            except BrokenPipeError:
+                pass
+
+        try:
+            returncode = proc.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+            raise RuntimeError(f"ffmpeg timed out after {timeout:.0f}s")
+
+        if returncode != 0:
+            errlog.seek(0)
+            stderr = errlog.read().decode("utf-8", "replace")
+            raise RuntimeError(f"ffmpeg failed: {stderr[:500]}")
+
+
 def export_mp4(
-    frames: list[Image.Image],
+    frames: Sequence[Image.Image],
     output_path: Path,
     fps: int = 30,
     crf: int = 18,
     audio_path: Optional[Path] = None,
+    hw_accel: bool = True,
 ) -> ExportResult:
     """Export frames as H.264 MP4 via ffmpeg.
 
     Args:
-        frames: List of PIL Image frames.
+        frames: Sequence of PIL Image frames.
         output_path: Output .mp4 path.
         fps: Frames per second.
         crf: Constant Rate Factor (lower = higher quality).
         audio_path: Optional audio file to mux in.
+        hw_accel: Prefer a hardware encoder when ffmpeg has one, falling
+            back to libx264 if it fails.
     """
     if not _check_ffmpeg():
         raise RuntimeError("ffmpeg not found — required for MP4 export")
@@ -141,35 +346,26 @@ def export_mp4(
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with tempfile.TemporaryDirectory(prefix="demo-export-") as tmpdir:
-        tmpdir = Path(tmpdir)
-
-        # Write frames as PNGs
-        for i, frame in enumerate(frames):
-            frame.save(tmpdir / f"{i:06d}.png")
-
-        cmd = [
-            "ffmpeg", "-y",
-            "-framerate", str(fps),
-            "-i", str(tmpdir / "%06d.png"),
+    encoders = []
+    if hw_accel:
+        available = _available_encoders()
+        encoders = [
+            e for e in HW_H264_ENCODERS
+            if e in available and e not in _FAILED_ENCODERS
         ]
-
-        if audio_path and audio_path.exists():
-            cmd.extend(["-i", str(audio_path), "-shortest"])
-
-        cmd.extend([
-            "-c:v", "libx264",
-            "-crf", str(crf),
-            "-pix_fmt", "yuv420p",
-            "-movflags", "+faststart",
-            str(output_path),
-        ])
-
-        result = subprocess.run(
-            cmd, capture_output=True, text=True, timeout=300
-        )
-        if result.returncode != 0:
-            raise RuntimeError(f"ffmpeg failed: {result.stderr[:500]}")
+    encoders.append("libx264")
+
+    for encoder in encoders:
+        try:
+            _encode_video(
+                frames, output_path, fps, _h264_args(encoder, crf), audio_path
+            )
+            break
+        except RuntimeError:
+            if encoder == "libx264":
+                raise
+            # Compiled in but unusable here; don't try it again this process
+            _FAILED_ENCODERS.add(encoder)
 
     stat = output_path.stat()
     return ExportResult(
@@ -182,7 +378,7 @@ def export_mp4(
 
 
 def export_webm(
-    frames: list[Image.Image],
+    frames: Sequence[Image.Image],
     output_path: Path,
     fps: int = 30,
     crf: int = 30,
@@ -195,34 +391,18 @@ def export_webm(
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with tempfile.TemporaryDirectory(prefix="demo-export-") as tmpdir:
-        tmpdir = Path(tmpdir)
-
-        for i, frame in enumerate(frames):
-            frame.save(tmpdir / f"{i:06d}.png")
-
-        cmd = [
-            "ffmpeg", "-y",
-            "-framerate", str(fps),
-            "-i", str(tmpdir / "%06d.png"),
-        ]
-
-        if audio_path and audio_path.exists():
-            cmd.extend(["-i", str(audio_path), "-shortest"])
-
-        cmd.extend([
+    _encode_video(
+        frames,
+        output_path,
+        fps,
+        [
             "-c:v", "libvpx-vp9",
             "-crf", str(crf),
             "-b:v", "0",
             "-pix_fmt", "yuv420p",
-            str(output_path),
-        ])
-
-        result = subprocess.run(
-            cmd, capture_output=True, text=True, timeout=300
-        )
-        if result.returncode != 0:
-            raise RuntimeError(f"ffmpeg failed: {result.stderr[:500]}")
+        ],
+        audio_path,
+    )
 
     stat = output_path.stat()
     return ExportResult(
@@ -237,7 +417,7 @@ def export_webm(
 # ── Cover image ───────────────────────────────────────────────────────────
 
 def export_cover(
-    frames: list[Image.Image],
+    frames: Sequence[Image.Image],
     output_path: Path,
     mode: str = "auto",
     frame_idx: Optional[int] = None,
@@ -274,13 +454,42 @@ def export_cover(
 
 # ── Social cuts ───────────────────────────────────────────────────────────
 
+class FrameRange(Sequence[Image.Image]):
+    """Read-only view of ``src[start:end]`` that doesn't copy the frame list."""
+
+    def __init__(self, src: Sequence[Image.Image], start: int, end: int) -> None:
+        self.src = src
+        self.start = start
+        self.end = end
+
+    def __len__(self) -> int:
+        return self.end - self.start
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                return [self[i] for i in range(start, stop, step)]
+            return FrameRange(self.src, self.start + start, self.start + max(start, stop))
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("frame index out of range")
+        return self.src[self.start + index]
+
+    def __iter__(self) -> Iterator[Image.Image]:
+        return itertools.islice(self.src, self.start, self.end)
+
+
 def cut_frames(
-    frames: list[Image.Image],
+    frames: Sequence[Image.Image],
     fps: int,
     cut_duration: str,
-) -> list[Image.Image]:
+) -> Sequence[Image.Image]:
     """Extract a subset of frames for a social media cut.
 
+    The cut is a ``FrameRange`` view over ``frames`` rather than a copy.
+
     Args:
         cut_duration: Duration string like "8s", "15s", "30s", "45s".
     """
@@ -297,7 +506,7 @@ def cut_frames(
     if end - start < max_frames:
         start = max(0, end - max_frames)
 
-    return frames[start:end]
+    return FrameRange(frames, start, end)
 
 
 # ── Output naming ─────────────────────────────────────────────────────────
@@ -318,7 +527,7 @@ def generate_output_name(
 # ── Master export orchestrator ────────────────────────────────────────────
 
 def export_all(
-    frames: list[Image.Image],
+    frames: Sequence[Image.Image],
     config: RenderConfig,
     scene_id: str = "demo",
     audio_path: Optional[Path] = None,
@@ -350,27 +559,38 @@ def export_all(
     if config.cut:
         export_frames = cut_frames(frames, fps, config.cut)
 
-    # GIF
-    if "gif" in formats:
-        name = generate_output_name(config, scene_id, "gif")
-        result = export_gif(export_frames, outdir / name, fps=fps)
-        manifest.add(result)
-
-    # MP4
-    if "mp4" in formats:
-        name = generate_output_name(config, scene_id, "mp4")
-        result = export_mp4(
-            export_frames, outdir / name, fps=fps, audio_path=audio_path
-        )
-        manifest.add(result)
-
-    # WebM
-    if "webm" in formats:
-        name = generate_output_name(config, scene_id, "webm")
-        result = export_webm(
-            export_frames, outdir / name, fps=fps, audio_path=audio_path
-        )
-        manifest.add(result)
+    # Formats only read the shared frame list, and each spends most of its
+    # time in C (quantize) or in an ffmpeg subprocess, so run them together
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        futures = []
+
+        # GIF
+        if "gif" in formats:
+            name = generate_output_name(config, scene_id, "gif")
+            futures.append(pool.submit(
+                export_gif, export_frames, outdir / name,
+                fps=fps, encoder=config.gif_encoder,
+            ))
+
+        # MP4
+        if "mp4" in formats:
+            name = generate_output_name(config, scene_id, "mp4")
+            futures.append(pool.submit(
+                export_mp4, export_frames, outdir / name,
+                fps=fps, audio_path=audio_path, hw_accel=config.hw_accel,
+            ))
+
+        # WebM
+        if "webm" in formats:
+            name = generate_output_name(config, scene_id, "webm")
+            futures.append(pool.submit(
+                export_webm, export_frames, outdir / name,
+                fps=fps, audio_path=audio_path,
+            ))
+
+        # Manifest order stays gif → mp4 → webm regardless of finish order
+        for future in futures:
+            manifest.add(future.result())
 
     # Cover PNG (always generated)
     cover_name = generate_output_name(config, scene_id, "png")
@@ -10,14 +10,21 @@ Handles:
 
 from __future__ import annotations
 
+import hashlib
+import json
+import os
+import shutil
 import subprocess
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional
 
+from fontTools.ttLib import TTFont
 from PIL import ImageFont
 
+from demo_engine.config import CACHE_DIR
+
 # ── Font profiles ─────────────────────────────────────────────────────────
 
 FONT_PROFILES: dict[str, list[str]] = {
@@ -57,6 +64,17 @@ class FontStack:
     size: int = DEFAULT_FONT_SIZE
     bold: Optional[ImageFont.FreeTypeFont] = None
     bold_path: Optional[str] = None
+    # Codepoints the primary lacks → first fallback that has them, built
+    # from the font cmaps; None when a cmap couldn't be read
+    char_to_font: Optional[dict[int, ImageFont.FreeTypeFont]] = field(
+        default=None, repr=False
+    )
+    # Every codepoint some font in the stack maps, for set-based audits
+    covered_codepoints: Optional[frozenset[int]] = field(default=None, repr=False)
+    # Memoized _stack_covers answers, shared by every audit of this stack
+    _coverage: dict[str, bool] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
     def get_font_for_char(self, char: str) -> ImageFont.FreeTypeFont:
         """Return the best font for rendering a specific character.
@@ -64,6 +82,9 @@ class FontStack:
         Pillow doesn't do automatic font fallback, so we manually check
         glyph availability and select the appropriate font.
         """
+        if self.char_to_font is not None:
+            return self.char_to_font.get(ord(char), self.primary)
+
         if _font_has_glyph(self.primary, char):
             return self.primary
         for fb in self.fallbacks:
@@ -72,9 +93,18 @@ class FontStack:
         # Fall back to primary even if glyph is missing
         return self.primary
 
+    def signature(self) -> str:
+        """Stable identifier for the fonts in this stack (for cache keys)."""
+        return "|".join([self.primary_path, *self.fallback_paths, str(self.size)])
+
 
+@lru_cache(maxsize=16384)
 def _font_has_glyph(font: ImageFont.FreeTypeFont, char: str) -> bool:
-    """Check if a font can render a specific character (non-tofu)."""
+    """Check if a font can render a specific character (non-tofu).
+
+    Probing rasterizes the glyph, so results are cached per (font, char);
+    the cache holds a reference to each font, so keys can't be recycled.
+    """
     try:
         # Use getmask to check — returns None-width for missing glyphs
         mask = font.getmask(char)
@@ -83,18 +113,123 @@ def _font_has_glyph(font: ImageFont.FreeTypeFont, char: str) -> bool:
         return False
 
 
+def _stack_covers(font_stack: FontStack, text: str) -> bool:
+    """Whether any font in the stack has a glyph for ``text``.
+
+    Uses the stack's cmap union when available (pure set lookups), and
+    otherwise probes each font by rasterizing. Answers are memoized on the
+    stack, so audits across themes and scenes check each text once.
+    """
+    known = font_stack._coverage.get(text)
+    if known is not None:
+        return known
+    covered = font_stack.covered_codepoints
+    if covered is not None:
+        result = all(ord(c) in covered for c in text)
+    else:
+        result = any(
+            _font_has_glyph(font, text)
+            for font in (font_stack.primary, *font_stack.fallbacks)
+        )
+    font_stack._coverage[text] = result
+    return result
+
+
+@lru_cache(maxsize=None)
+def _load_cmap(path: str) -> Optional[frozenset[int]]:
+    """Codepoints mapped by a font file's best cmap, or None if unreadable."""
+    try:
+        with TTFont(path, lazy=True, fontNumber=0) as tt:
+            return frozenset(tt.getBestCmap() or ())
+    except Exception:
+        return None
+
+
+def stack_coverage(paths: Iterable[str]) -> Optional[frozenset[int]]:
+    """Union of the cmaps of every font file, or None if any is unreadable."""
+    covered: set[int] = set()
+    for path in paths:
+        cmap = _load_cmap(path)
+        if cmap is None:
+            return None
+        covered |= cmap
+    return frozenset(covered)
+
+
+def build_char_map(
+    primary_path: str,
+    fallbacks: list[ImageFont.FreeTypeFont],
+    fallback_paths: list[str],
+) -> Optional[dict[int, ImageFont.FreeTypeFont]]:
+    """Map each codepoint missing from the primary to its first fallback.
+
+    Returns None if any cmap can't be read, so callers fall back to
+    probing glyphs one at a time.
+    """
+    covered = _load_cmap(primary_path)
+    if covered is None:
+        return None
+
+    char_map: dict[int, ImageFont.FreeTypeFont] = {}
+    for font, path in zip(fallbacks, fallback_paths):
+        cmap = _load_cmap(path)
+        if cmap is None:
+            return None
+        for cp in cmap - covered:
+            char_map[cp] = font
+        covered = covered | cmap
+    return char_map
+
+
 # ── System font discovery ─────────────────────────────────────────────────
 
+FONT_LIST_CACHE = CACHE_DIR / "fontlist.json"
+
+# fontconfig rewrites its caches whenever installed fonts change
+FONTCONFIG_CACHE_DIRS = (
+    Path("/var/cache/fontconfig"),
+    Path.home() / ".cache" / "fontconfig",
+    # Homebrew fontconfig on Apple Silicon and Intel macOS
+    Path("/opt/homebrew/var/cache/fontconfig"),
+    Path("/usr/local/var/cache/fontconfig"),
+)
+FONT_DIRS = (
+    Path("/usr/share/fonts"),
+    Path("/usr/local/share/fonts"),
+    Path.home() / ".local" / "share" / "fonts",
+    Path.home() / ".fonts",
+    Path("/Library/Fonts"),
+    Path.home() / "Library" / "Fonts",
+)
+
+
 @lru_cache(maxsize=1)
 def discover_system_fonts() -> dict[str, str]:
     """Discover monospace fonts available on the system via fc-list.
 
+    The result is persisted to ``FONT_LIST_CACHE`` and reused until the
+    fc-list binary, fontconfig's own caches, or any directory under
+    ``FONT_DIRS`` change. If fc-list hangs, the standard font directories
+    are scanned directly instead, and that partial result is not cached.
+
     Returns dict mapping family name → file path.
     """
+    fc_list = shutil.which("fc-list")
+    if fc_list is None:
+        return {}
+
+    stamp = _font_list_stamp(fc_list)
+    try:
+        cached = json.loads(FONT_LIST_CACHE.read_text())
+        if cached.get("stamp") == stamp:
+            return dict(cached["fonts"])
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        pass
+
     fonts: dict[str, str] = {}
     try:
         result = subprocess.run(
-            ["fc-list", ":spacing=100", "family", "file"],
+            [fc_list, ":spacing=100", "family", "file"],
             capture_output=True,
             text=True,
             timeout=5,
@@ -109,13 +244,82 @@ def discover_system_fonts() -> dict[str, str]:
             for fam in families:
                 if fam and file_path:
                     fonts[fam] = file_path
-    except (subprocess.TimeoutExpired, FileNotFoundError):
+    except subprocess.TimeoutExpired:
+        return _scan_font_dirs()
+    except FileNotFoundError:
+        return fonts
+
+    try:
+        FONT_LIST_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        tmp = FONT_LIST_CACHE.with_suffix(".tmp")
+        tmp.write_text(json.dumps({"stamp": stamp, "fonts": fonts}))
+        os.replace(tmp, FONT_LIST_CACHE)
+    except OSError:
         pass
     return fonts
 
 
+def _font_list_stamp(fc_list: str) -> list[float]:
+    """Modification times that change whenever installed fonts do.
+
+    Font directories are included because fonts copied into them (e.g.
+    ``~/.fonts``) are visible to fc-list before fc-cache is rerun; every
+    subdirectory is walked, since adding a file only touches its parent.
+    """
+    stamp = []
+    for path in (Path(fc_list), *FONTCONFIG_CACHE_DIRS):
+        try:
+            stamp.append(path.stat().st_mtime)
+        except OSError:
+            stamp.append(0.0)
+    for font_dir in FONT_DIRS:
+        for dirpath, _dirnames, _filenames in os.walk(font_dir):
+            try:
+                stamp.append(os.stat(dirpath).st_mtime)
+            except OSError:
+                pass
+    return stamp
+
+
+def _scan_font_dirs() -> dict[str, str]:
+    """Find fixed-pitch fonts by reading font files directly (no fontconfig)."""
+    fonts: dict[str, str] = {}
+    for root in FONT_DIRS:
+        if not root.is_dir():
+            continue
+        for path in sorted(root.rglob("*")):
+            if path.suffix.lower() not in (".ttf", ".otf"):
+                continue
+            try:
+                with TTFont(path, lazy=True, fontNumber=0) as tt:
+                    if not tt["post"].isFixedPitch:
+                        continue
+                    family = tt["name"].getBestFamilyName()
+                    style = tt["name"].getBestSubFamilyName()
+            except Exception:
+                continue
+            # Prefer the regular face; bold is derived from its path
+            if family and (family not in fonts or style in ("Regular", "Book")):
+                fonts[family] = str(path)
+    return fonts
+
+
+@lru_cache(maxsize=1)
+def _lowered_system_fonts() -> dict[str, str]:
+    """``discover_system_fonts`` keyed by lowercased family name."""
+    lowered: dict[str, str] = {}
+    for name, path in discover_system_fonts().items():
+        lowered.setdefault(name.lower(), path)
+    return lowered
+
+
+@lru_cache(maxsize=None)
 def find_font_path(family: str) -> Optional[str]:
-    """Find a specific font family's file path on the system."""
+    """Find a specific font family's file path on the system.
+
+    Results, including misses, are cached; profiles probe the same
+    families on every renderer startup.
+    """
     system_fonts = discover_system_fonts()
 
     # Exact match
@@ -124,8 +328,8 @@ def find_font_path(family: str) -> Optional[str]:
 
     # Partial match
     family_lower = family.lower()
-    for name, path in system_fonts.items():
-        if family_lower in name.lower():
+    for name, path in _lowered_system_fonts().items():
+        if family_lower in name:
             return path
 
     return None
@@ -141,12 +345,12 @@ def resolve_font_stack(
     Adds symbol fallback fonts afterward.
     """
     families = FONT_PROFILES.get(profile, FONT_PROFILES["nerd-safe"])
+    resolved = [(fam, find_font_path(fam)) for fam in families]
 
     primary_path = None
     primary_family = None
 
-    for fam in families:
-        path = find_font_path(fam)
+    for fam, path in resolved:
         if path:
             primary_path = path
             primary_family = fam
@@ -174,10 +378,9 @@ def resolve_font_stack(
     # Build fallback chain
     fallbacks = []
     fallback_paths = []
-    for fam in families:
+    for fam, path in resolved:
         if fam == primary_family:
             continue
-        path = find_font_path(fam)
         if path:
             try:
                 fallbacks.append(ImageFont.truetype(path, size))
@@ -203,6 +406,8 @@ def resolve_font_stack(
         size=size,
         bold=bold_font,
         bold_path=bold_path,
+        char_to_font=build_char_map(primary_path, fallbacks, fallback_paths),
+        covered_codepoints=stack_coverage([primary_path, *fallback_paths]),
     )
 
 
@@ -225,6 +430,18 @@ class GlyphAuditResult:
     def is_clean(self) -> bool:
         return len(self.missing) == 0
 
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> GlyphAuditResult:
+        return cls(
+            total_chars=data["total_chars"],
+            covered=data["covered"],
+            missing=list(data["missing"]),
+            substitutions=dict(data["substitutions"]),
+        )
+
     def report(self) -> str:
         lines = [
             f"Glyph Audit Report",
@@ -260,50 +477,100 @@ def audit_glyphs(
     Returns:
         GlyphAuditResult with coverage info.
     """
+    return audit_glyphs_from_set(set(text_corpus), font_stack, glyph_map)
+
+
+def audit_glyphs_from_set(
+    charset: Iterable[str],
+    font_stack: FontStack,
+    glyph_map: Optional[dict[str, str]] = None,
+) -> GlyphAuditResult:
+    """Audit glyph coverage for a set of distinct characters.
+
+    Same as ``audit_glyphs`` but skips the corpus scan when the caller
+    already tracks unique characters (e.g. ``Timeline.charset``).
+    """
     glyph_map = glyph_map or {}
-    unique_chars = set(text_corpus) - {"\n", "\r", "\t", " "}
+    unique_chars = set(charset) - {"\n", "\r", "\t", " "}
     result = GlyphAuditResult(total_chars=len(unique_chars))
 
     for char in sorted(unique_chars):
         # Check if theme has a substitution
         if char in glyph_map:
             result.substitutions[char] = glyph_map[char]
-            sub_char = glyph_map[char]
-            if _font_has_glyph(font_stack.primary, sub_char):
-                result.covered += 1
-                continue
-            # Check fallbacks for substituted char
-            found = False
-            for fb in font_stack.fallbacks:
-                if _font_has_glyph(fb, sub_char):
-                    result.covered += 1
-                    found = True
-                    break
-            if not found:
-                result.missing.append(char)
-            continue
+            target = glyph_map[char]
+        else:
+            target = char
 
-        # Check primary font
-        if _font_has_glyph(font_stack.primary, char):
+        if _stack_covers(font_stack, target):
             result.covered += 1
-            continue
+        else:
+            result.missing.append(char)
 
-        # Check fallbacks
-        found = False
-        for fb in font_stack.fallbacks:
-            if _font_has_glyph(fb, char):
-                result.covered += 1
-                found = True
-                break
+    return result
 
-        if not found:
-            result.missing.append(char)
 
+def audit_glyphs_cached(
+    charset: Iterable[str],
+    font_stack: FontStack,
+    glyph_map: Optional[dict[str, str]] = None,
+    cache_dir: Optional[Path] = None,
+) -> GlyphAuditResult:
+    """Audit glyph coverage, reusing a previous result for identical input.
+
+    Results are stored as JSON under ``cache_dir`` keyed by a hash of the
+    distinct characters, glyph map, and font stack signature. With
+    ``cache_dir=None`` this is a plain ``audit_glyphs_from_set`` call.
+    """
+    chars = set(charset)
+    if cache_dir is None:
+        return audit_glyphs_from_set(chars, font_stack, glyph_map)
+
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update("".join(sorted(chars)).encode("utf-8"))
+    digest.update(json.dumps(glyph_map or {}, sort_keys=True).encode("utf-8"))
+    digest.update(font_stack.signature().encode("utf-8"))
+    # cmap and probe audits can disagree (e.g. on .notdef boxes)
+    digest.update(b"cmap" if font_stack.covered_codepoints is not None else b"probe")
+    cache_path = Path(cache_dir) / "glyph_audit" / f"{digest.hexdigest()}.json"
+
+    try:
+        return GlyphAuditResult.from_dict(json.loads(cache_path.read_text()))
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    result = audit_glyphs_from_set(chars, font_stack, glyph_map)
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(json.dumps(result.to_dict()))
+    except OSError:
+        pass
     return result
 
 
-def apply_glyph_map(text: str, glyph_map: dict[str, str]) -> str:
-    """Apply theme glyph substitutions to text."""
+def glyph_translation(glyph_map: dict[str, str]) -> Optional[dict[int, str]]:
+    """Build a ``str.translate`` table for a glyph map.
+
+    Returns None when any source spans several code points (e.g. an emoji
+    with a variation selector), which translate can't match.
+    """
+    if all(len(src) == 1 for src in glyph_map):
+        return str.maketrans(glyph_map)
+    return None
+
+
+def apply_glyph_map(
+    text: str,
+    glyph_map: dict[str, str],
+    table: Optional[dict[int, str]] = None,
+) -> str:
+    """Apply theme glyph substitutions to text.
+
+    Pass the ``glyph_translation`` table for the map to substitute in a
+    single pass instead of one ``replace`` per entry.
+    """
+    if table is not None:
+        return text.translate(table)
     for src, dst in glyph_map.items():
         text = text.replace(src, dst)
     return text
@@ -10,16 +10,29 @@ Renders themed terminal frames using Pillow with:
 
 from __future__ import annotations
 
+import hashlib
 import math
+import os
+import shutil
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional, Sequence
 
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageColor, ImageDraw, ImageFont
 
 from demo_engine.config import RenderConfig
 from demo_engine.effects import apply_effects, EffectsConfig
-from demo_engine.fonts import FontStack, apply_glyph_map, resolve_font_stack
+from demo_engine.export import ExportResult, export_mp4
+from demo_engine.fonts import (
+    FontStack,
+    apply_glyph_map,
+    glyph_translation,
+    resolve_font_stack,
+)
 from demo_engine.presets import Preset, get_preset
 from demo_engine.themes import Theme
 from demo_engine.timeline import (
@@ -30,6 +43,11 @@ from demo_engine.timeline import (
 )
 
 
+# Rasterized line masks kept per renderer; a frame shows at most a screen
+# of lines, so this covers many frames of history on long timelines
+LINE_CACHE_SIZE = 512
+
+
 # ── Layout constants ──────────────────────────────────────────────────────
 
 @dataclass
@@ -87,8 +105,17 @@ class TerminalLayout:
         return max(1, available // self.line_height)
 
 
-def compute_layout(width: int, height: int, font_size: int) -> TerminalLayout:
-    """Compute layout dimensions for given canvas size."""
+def compute_layout(
+    width: int,
+    height: int,
+    font_size: int,
+    char_width: Optional[int] = None,
+) -> TerminalLayout:
+    """Compute layout dimensions for given canvas size.
+
+    ``char_width`` is the measured cell advance of a monospace font; when
+    omitted it is estimated from the font size.
+    """
     scale = min(width / 1920, height / 1080)
     return TerminalLayout(
         canvas_w=width,
@@ -100,7 +127,7 @@ def compute_layout(width: int, height: int, font_size: int) -> TerminalLayout:
         padding_y=int(16 * scale),
         corner_radius=int(12 * scale),
         line_height=int(font_size * 1.5),
-        char_width=int(font_size * 0.6),
+        char_width=char_width or int(font_size * 0.6),
         dot_radius=int(7 * scale),
         dot_spacing=int(24 * scale),
         dot_y_offset=int(20 * scale),
@@ -192,12 +219,49 @@ def draw_title_bar(
 class FrameState:
     """Tracks the visible state of the terminal across frames."""
 
-    lines: list[tuple[str, LineStyle]] = field(default_factory=list)
+    # Visible lines as parallel text/style columns; bounded deques drop the
+    # oldest line on overflow, which is the terminal scrolling
+    texts: deque[str] = field(default_factory=deque)
+    styles: deque[LineStyle] = field(default_factory=deque)
     overwrite_row: Optional[int] = None  # Row being overwritten (spinner/progress)
     cursor_visible: bool = True
     cursor_row: int = 0
     cursor_col: int = 0
 
+    @classmethod
+    def bounded(cls, max_lines: int) -> FrameState:
+        """Empty state that scrolls after ``max_lines`` lines."""
+        return cls(texts=deque(maxlen=max_lines), styles=deque(maxlen=max_lines))
+
+    def append(self, text: str, style: LineStyle) -> None:
+        self.texts.append(text)
+        self.styles.append(style)
+
+    def set_line(self, row: int, text: str, style: LineStyle) -> None:
+        self.texts[row] = text
+        self.styles[row] = style
+
+    def clear(self) -> None:
+        self.texts.clear()
+        self.styles.clear()
+
+
+def _cell_width(font: ImageFont.FreeTypeFont) -> Optional[int]:
+    """Advance width of a monospace font's cell, or None if proportional."""
+    try:
+        wide, narrow = font.getlength("M"), font.getlength("i")
+    except Exception:
+        return None
+    if wide != narrow or wide <= 0 or wide != int(wide):
+        return None
+    return int(wide)
+
+
+@lru_cache(maxsize=4096)
+def _advance(font: ImageFont.FreeTypeFont, char: str, cell: int) -> int:
+    """Advance width of one character, never less than one cell."""
+    return max(int(font.getlength(char)), cell)
+
 
 class FrameRenderer:
     """Renders timeline events into image frames.
@@ -205,7 +269,7 @@ class FrameRenderer:
     Usage:
         renderer = FrameRenderer(config, theme)
         frames = renderer.render_all(timeline)
-        renderer.save_frames(frames, output_dir)
+        renderer.save_frames(frames, output_dir)  # or encode_to_video(frames, path)
     """
 
     def __init__(
@@ -225,7 +289,36 @@ class FrameRenderer:
             config.font_profile, self.font_size
         )
 
-        self.layout = compute_layout(w, h, self.font_size)
+        cell_width = _cell_width(self.font_stack.primary)
+        self.layout = compute_layout(w, h, self.font_size, cell_width)
+        # Monospace primary runs advance by whole cells without measuring
+        self._primary_is_grid = cell_width is not None
+        self._glyph_table = glyph_translation(theme.glyph_map)
+        # Line colours parsed once per style rather than per line per frame
+        self._style_color = {
+            style: ImageColor.getrgb(resolve_color(style, theme)) for style in LineStyle
+        }
+        # Font, theme and layout are fixed per renderer, so line masks
+        # never need invalidating; least recently used ones are evicted
+        self._line_cache: OrderedDict[
+            tuple[str, LineStyle], Optional[tuple[Image.Image, tuple[int, int]]]
+        ] = OrderedDict()
+        # FreeType faces aren't safe to rasterize from several threads
+        self._font_lock = threading.Lock()
+        try:
+            self._title_font = self.font_stack.primary.font_variant(
+                size=max(10, self.font_size - 2)
+            )
+        except Exception:
+            self._title_font = self.font_stack.primary
+        self._chrome = self._render_chrome()
+        # Solid block matching the inclusive bounds draw.rectangle filled
+        self._cursor = Image.new(
+            "RGB",
+            (self.layout.char_width + 1, self.layout.line_height + 1),
+            theme.colors.cursor,
+        )
+        self._render_base = self._make_base_renderer()
 
         # Effects config from theme
         self.effects_config = EffectsConfig(
@@ -238,103 +331,131 @@ class FrameRenderer:
             effect_scale=self.preset.effect_scale,
         )
 
+    def frame_count(self, timeline: Timeline) -> int:
+        """Number of frames ``render_all`` will produce for a timeline."""
+        if not timeline.events:
+            return 0
+        frame_ms = 1000.0 / self.preset.fps
+        total_ms = timeline.duration_ms + 500  # Small buffer
+        return int(math.ceil(total_ms / frame_ms))
+
     def render_all(self, timeline: Timeline) -> list[Image.Image]:
         """Render the entire timeline into a list of PIL Image frames."""
         if not timeline.events:
             return []
 
-        fps = self.preset.fps
-        frame_ms = 1000.0 / fps
-        total_ms = timeline.duration_ms + 500  # Small buffer
-        num_frames = int(math.ceil(total_ms / frame_ms))
+        frame_ms = 1000.0 / self.preset.fps
+        num_frames = self.frame_count(timeline)
 
-        state = FrameState()
-        frames: list[Image.Image] = []
+        state = FrameState.bounded(self.layout.max_visible_lines)
+        pending: list[Future[Image.Image]] = []
+        last_sig: Optional[tuple] = None
+        content: tuple = ()
+        # Cursor blinks: visible for the first ~500ms of every second
+        cursor_on = [int(i * frame_ms / 500) % 2 == 0 for i in range(num_frames)]
         event_idx = 0
         events = timeline.events
 
-        for frame_num in range(num_frames):
-            t_ms = frame_num * frame_ms
-
-            # Apply all events up to this timestamp
-            while event_idx < len(events) and events[event_idx].t_ms <= t_ms:
-                event = events[event_idx]
-                self._apply_event(state, event)
-                event_idx += 1
+        # State is advanced in order here, and each distinct state is
+        # snapshotted so its base frame can be drawn on the pool. Effects
+        # chain on the base future; the queue is FIFO, so a base is always
+        # picked up before any effects task that waits on it.
+        with ThreadPoolExecutor() as pool:
+            for frame_num in range(num_frames):
+                t_ms = frame_num * frame_ms
+
+                # Apply all events up to this timestamp
+                applied = False
+                while event_idx < len(events) and events[event_idx].t_ms <= t_ms:
+                    event = events[event_idx]
+                    self._apply_event(state, event)
+                    event_idx += 1
+                    applied = True
+
+                # Between events only the cursor blink changes the base
+                # frame; effects never mutate it, so it can be shared. The
+                # content key is only rebuilt on frames where events fired.
+                if applied:
+                    content = (tuple(state.texts), tuple(state.styles),
+                               state.cursor_visible, state.cursor_row, state.cursor_col)
+                sig = (content, cursor_on[frame_num])
+                if sig != last_sig:
+                    snapshot = FrameState(
+                        texts=state.texts.copy(),
+                        styles=state.styles.copy(),
+                        cursor_visible=state.cursor_visible,
+                        cursor_row=state.cursor_row,
+                        cursor_col=state.cursor_col,
+                    )
+                    base = pool.submit(
+                        self._render_base, snapshot, cursor_on[frame_num]
+                    )
+                    last_sig = sig
+                pending.append(pool.submit(
+                    self._finish_frame, base, t_ms, frame_num
+                ))
 
-            # Render frame
-            img = self._render_frame(state, t_ms, frame_num)
-            frames.append(img)
+            return [future.result() for future in pending]
 
-        return frames
+    def _finish_frame(
+        self, base: Future[Image.Image], t_ms: float, frame_num: int
+    ) -> Image.Image:
+        """Apply per-frame effects once the shared base frame is drawn."""
+        return apply_effects(base.result(), self.effects_config, t_ms, frame_num)
 
     def _apply_event(self, state: FrameState, event: TimelineEvent) -> None:
-        """Update frame state based on a timeline event."""
-        if event.event_type in (EventType.LINE, EventType.COMMAND, EventType.BANNER):
+        """Update frame state based on a timeline event.
+
+        Glyph substitutions are applied here, once per event, so
+        ``state.texts`` holds display-ready text.
+        """
+        text = apply_glyph_map(
+            event.text or "", self.theme.glyph_map, self._glyph_table
+        )
+
+        # Enum members are singletons, so identity tests are the cheapest
+        # dispatch (Enum.__hash__ is Python-level, ruling out set lookups)
+        kind = event.event_type
+        if kind is EventType.LINE or kind is EventType.COMMAND or kind is EventType.BANNER:
             # New line(s) appended
-            for line in event.text.split("\n"):
-                state.lines.append((line, event.style))
+            for line in text.split("\n"):
+                state.append(line, event.style)
             state.overwrite_row = None
 
-            # Keep only visible lines
-            max_lines = self.layout.max_visible_lines
-            if len(state.lines) > max_lines:
-                state.lines = state.lines[-max_lines:]
-
-        elif event.event_type == EventType.SPINNER_FRAME:
-            # Overwrite the last line (or specific row)
-            if event.row is not None and event.row < len(state.lines):
-                state.lines[event.row] = (event.text, event.style)
-            elif state.overwrite_row is not None and state.overwrite_row < len(state.lines):
-                state.lines[state.overwrite_row] = (event.text, event.style)
-            elif state.lines:
-                # First spinner frame: append, then track for overwrite
-                if state.overwrite_row is None:
-                    state.lines.append((event.text, event.style))
-                    state.overwrite_row = len(state.lines) - 1
-                else:
-                    state.lines[-1] = (event.text, event.style)
-            else:
-                state.lines.append((event.text, event.style))
-                state.overwrite_row = 0
-
-        elif event.event_type == EventType.PROGRESS_FRAME:
-            # Same overwrite behavior as spinner
-            if event.row is not None and event.row < len(state.lines):
-                state.lines[event.row] = (event.text, event.style)
-            elif state.overwrite_row is not None and state.overwrite_row < len(state.lines):
-                state.lines[state.overwrite_row] = (event.text, event.style)
-            elif state.lines:
-                if state.overwrite_row is None:
-                    state.lines.append((event.text, event.style))
-                    state.overwrite_row = len(state.lines) - 1
-                else:
-                    state.lines[-1] = (event.text, event.style)
-            else:
-                state.lines.append((event.text, event.style))
-                state.overwrite_row = 0
-
-        elif event.event_type == EventType.CLEAR:
-            state.lines.clear()
+        elif kind is EventType.SPINNER_FRAME or kind is EventType.PROGRESS_FRAME:
+            self._apply_overwrite(state, text, event)
+
+        elif kind is EventType.CLEAR:
+            state.clear()
             state.overwrite_row = None
 
-        elif event.event_type == EventType.TRANSITION:
+        elif kind is EventType.TRANSITION:
             # Reset overwrite tracking on transitions
             state.overwrite_row = None
 
         # Update cursor position
-        if state.lines:
-            state.cursor_row = len(state.lines) - 1
-            last_text = state.lines[-1][0]
+        if state.texts:
+            state.cursor_row = len(state.texts) - 1
+            last_text = state.texts[-1]
             state.cursor_col = len(last_text)
 
-    def _render_frame(
-        self,
-        state: FrameState,
-        t_ms: float,
-        frame_num: int,
-    ) -> Image.Image:
-        """Render a single frame image."""
+    @staticmethod
+    def _apply_overwrite(state: FrameState, text: str, event: TimelineEvent) -> None:
+        """Overwrite a spinner/progress row, appending it on the first frame.
+
+        The target is the event's explicit row, else the row the previous
+        frame wrote; without either, the line is appended and tracked.
+        """
+        n = len(state.texts)
+        target = event.row if event.row is not None and event.row < n else state.overwrite_row
+        if target is None or target >= n:
+            state.append(text, event.style)
+            state.overwrite_row = len(state.texts) - 1
+        else:
+            state.set_line(target, text, event.style)
+
+    def _render_chrome(self) -> Image.Image:
+        """Background, panel and title bar, which are fixed for a render."""
         w, h = self.config.resolution
         img = Image.new("RGB", (w, h), self.theme.colors.bg)
         draw = ImageDraw.Draw(img)
@@ -353,50 +474,90 @@ class FrameRenderer:
         )
 
         # Title bar
-        title_font = None
-        try:
-            title_font = self.font_stack.primary.font_variant(size=max(10, self.font_size - 2))
-        except Exception:
-            title_font = self.font_stack.primary
-        draw_title_bar(draw, layout, theme, title="demo-engine", font=title_font)
+        draw_title_bar(draw, layout, theme, title="demo-engine", font=self._title_font)
 
-        # Text content
-        x = layout.content_x
-        y = layout.content_y
-        font = self.font_stack.primary
-
-        for i, (text, style) in enumerate(state.lines):
-            if y + layout.line_height > layout.terminal_y + layout.terminal_h - layout.padding_y:
-                break
-
-            color = resolve_color(style, theme)
-
-            # Apply glyph map
-            text = apply_glyph_map(text, theme.glyph_map)
-
-            # Render text with per-character font fallback
-            self._draw_text_with_fallback(draw, x, y, text, color, font)
-
-            y += layout.line_height
-
-        # Cursor blink (visible every other ~500ms)
-        if state.cursor_visible and state.lines:
-            cursor_phase = int(t_ms / 500) % 2
-            if cursor_phase == 0:
-                cursor_x = x + state.cursor_col * layout.char_width
-                cursor_y_pos = layout.content_y + state.cursor_row * layout.line_height
-                if cursor_y_pos + layout.line_height < layout.terminal_y + layout.terminal_h:
-                    draw.rectangle(
-                        (cursor_x, cursor_y_pos,
-                         cursor_x + layout.char_width,
-                         cursor_y_pos + layout.line_height),
-                        fill=theme.colors.cursor,
-                    )
+        return img
 
-        # Apply visual effects
-        img = apply_effects(img, self.effects_config, t_ms=t_ms, frame_num=frame_num)
+    def _make_base_renderer(self) -> Callable[[FrameState, bool], Image.Image]:
+        """Build ``_render_base`` with per-render constants bound as locals.
 
-        return img
+        Layout, chrome and colours are fixed for the renderer's lifetime,
+        so the returned closure only reads its arguments and fast locals.
+        """
+        layout = self.layout
+        chrome = self._chrome
+        cursor = self._cursor
+        style_color = self._style_color
+        line_strip = self._line_strip
+        x = layout.content_x
+        top = layout.content_y
+        line_height = layout.line_height
+        char_width = layout.char_width
+        text_bottom = layout.terminal_y + layout.terminal_h - layout.padding_y
+        cursor_bottom = layout.terminal_y + layout.terminal_h
+
+        def render_base(state: FrameState, cursor_on: bool) -> Image.Image:
+            """Render the terminal frame for ``state`` before effects.
+
+            An empty terminal is the chrome itself; effects never mutate
+            their input, so it is shared instead of copied.
+            """
+            if not state.texts:
+                return chrome
+
+            img = chrome.copy()
+            draw = ImageDraw.Draw(img)
+
+            # Text content
+            y = top
+            for text, style in zip(state.texts, state.styles):
+                if y + line_height > text_bottom:
+                    break
+                strip = line_strip(text, style)
+                if strip is not None:
+                    mask, (dx, dy) = strip
+                    draw.bitmap((x + dx, y + dy), mask, fill=style_color[style])
+                y += line_height
+
+            # Cursor blink phase is precomputed per frame by render_all
+            if cursor_on and state.cursor_visible:
+                cursor_x = x + state.cursor_col * char_width
+                cursor_y = top + state.cursor_row * line_height
+                if cursor_y + line_height < cursor_bottom:
+                    img.paste(cursor, (cursor_x, cursor_y))
+
+            return img
+
+        return render_base
+
+    def _line_strip(
+        self, text: str, style: LineStyle
+    ) -> Optional[tuple[Image.Image, tuple[int, int]]]:
+        """Rasterized coverage mask for one line, cropped to its ink.
+
+        Lines repeat across most frames, so masks are memoized by
+        ``(text, style)`` and stamped in the line colour; returns None for
+        lines with no visible ink.
+        """
+        key = (text, style)
+        cache = self._line_cache
+        with self._font_lock:
+            if key in cache:
+                cache.move_to_end(key)
+                return cache[key]
+            layout = self.layout
+            mask = Image.new("L", (layout.canvas_w - layout.content_x, layout.line_height))
+            self._draw_text_with_fallback(
+                ImageDraw.Draw(mask), 0, 0,
+                text, 255,
+                self.font_stack.primary,
+            )
+            bbox = mask.getbbox()
+            strip = (mask.crop(bbox), bbox[:2]) if bbox else None
+            cache[key] = strip
+            if len(cache) > LINE_CACHE_SIZE:
+                cache.popitem(last=False)
+        return strip
 
     def _draw_text_with_fallback(
         self,
@@ -404,39 +565,124 @@ class FrameRenderer:
         x: int,
         y: int,
         text: str,
-        color: str,
+        color: str | int,
         default_font: ImageFont.FreeTypeFont,
     ) -> None:
-        """Render text with per-character font fallback for missing glyphs."""
+        """Render text with per-character font fallback for missing glyphs.
+
+        Runs in a monospace primary font sit on the cell grid already and
+        are drawn with one ``draw.text`` call; any other font is drawn a
+        character at a time, each advancing at least one cell so columns
+        stay aligned.
+        """
+        cell = self.layout.char_width
+        grid_font = self.font_stack.primary if self._primary_is_grid else None
         cursor_x = x
-        for char in text:
+        for font, run in self._font_runs(text, default_font):
+            if font is grid_font:
+                try:
+                    draw.text((cursor_x, y), run, fill=color, font=font)
+                except Exception:
+                    pass
+                cursor_x += len(run) * cell
+                continue
+            for char in run:
+                if char == " ":
+                    cursor_x += cell
+                    continue
+                try:
+                    draw.text((cursor_x, y), char, fill=color, font=font)
+                    cursor_x += _advance(font, char, cell)
+                except Exception:
+                    cursor_x += cell
+
+    def _font_runs(
+        self, text: str, default_font: ImageFont.FreeTypeFont
+    ) -> list[tuple[ImageFont.FreeTypeFont, str]]:
+        """Split text into (font, substring) runs; spaces join the current run."""
+        runs: list[tuple[ImageFont.FreeTypeFont, str]] = []
+        run_font = default_font
+        start = 0
+        for i, char in enumerate(text):
             if char == " ":
-                cursor_x += self.layout.char_width
                 continue
-
             font = self.font_stack.get_font_for_char(char)
-            try:
-                draw.text((cursor_x, y), char, fill=color, font=font)
-                bbox = font.getbbox(char)
-                char_w = bbox[2] - bbox[0] if bbox else self.layout.char_width
-                cursor_x += max(char_w, self.layout.char_width)
-            except Exception:
-                cursor_x += self.layout.char_width
+            if font is not run_font:
+                if i > start:
+                    runs.append((run_font, text[start:i]))
+                run_font, start = font, i
+        if start < len(text):
+            runs.append((run_font, text[start:]))
+        return runs
 
     def save_frames(
         self,
-        frames: list[Image.Image],
+        frames: Sequence[Image.Image],
         output_dir: Path,
         prefix: str = "frame",
+        compress_level: Optional[int] = None,
     ) -> list[Path]:
-        """Save frames as numbered PNGs."""
+        """Save frames as numbered PNGs.
+
+        Pillow's PNG encoder releases the GIL, so frames are written on a
+        thread pool. A frame identical to the one before it (static holds)
+        is hard-linked to that frame's file instead of re-encoded. Pass a
+        low ``compress_level`` when the PNGs are only an intermediate;
+        by default Pillow's own level is used.
+        """
         output_dir = Path(output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        paths = []
+        paths = [output_dir / f"{prefix}_{i:06d}.png" for i in range(len(frames))]
+
+        # Map each frame to the first path holding the same content
+        sources: list[int] = []
+        prev: Optional[Image.Image] = None
+        prev_digest = b""
         for i, frame in enumerate(frames):
-            path = output_dir / f"{prefix}_{i:06d}.png"
-            frame.save(path)
-            paths.append(path)
+            if frame is prev:
+                sources.append(sources[-1])
+                continue
+            digest = hashlib.blake2b(frame.tobytes(), digest_size=16).digest()
+            sources.append(sources[-1] if digest == prev_digest else i)
+            prev, prev_digest = frame, digest
+
+        options = {} if compress_level is None else {"compress_level": compress_level}
+
+        def save(i: int) -> None:
+            frames[i].save(paths[i], **options)
+
+        with ThreadPoolExecutor() as pool:
+            list(pool.map(save, sorted(set(sources))))
+
+        for i, src in enumerate(sources):
+            if src != i:
+                _link_or_copy(paths[src], paths[i])
 
         return paths
+
+    def encode_to_video(
+        self,
+        frames: Sequence[Image.Image],
+        output_path: Path,
+        crf: int = 18,
+        audio_path: Optional[Path] = None,
+    ) -> ExportResult:
+        """Encode frames straight to an MP4, skipping PNG intermediates.
+
+        Frames are streamed to ffmpeg as raw RGB over a pipe, so nothing
+        is deflated or written to disk besides the video itself.
+        """
+        return export_mp4(
+            frames, output_path, fps=self.preset.fps, crf=crf,
+            audio_path=audio_path, hw_accel=self.config.hw_accel,
+        )
+
+
+def _link_or_copy(src: Path, dst: Path) -> None:
+    """Hard-link ``dst`` to ``src``, copying where links aren't supported."""
+    dst.unlink(missing_ok=True)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
@@ -15,14 +15,20 @@ Template variables:
 
 from __future__ import annotations
 
+import copy
 import datetime
 import re
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
 from demo_engine.config import SCENES_DIR, RenderConfig
 from demo_engine.presets import Preset, get_preset
 from demo_engine.timeline import EventType, LineStyle, Timeline, TimelineEvent
@@ -61,8 +67,14 @@ BANNERS: dict[str, str] = {
     ),
 }
 
+# Banners are static art; only run template expansion on ones that need it
+_BANNER_HAS_TEMPLATE: dict[str, bool] = {k: "{{" in v for k, v in BANNERS.items()}
+
+# Horizontal rule used by the built-in scene
+_HR = "━" * 60
+
 
-@dataclass
+@dataclass(slots=True)
 class SceneStep:
     """A single step in a scene definition."""
 
@@ -78,8 +90,13 @@ class SceneStep:
     transition: str = "cut"  # For transitions: cut, fade, wipe, glitch
     banner_name: str = ""  # Named banner from BANNERS dict
 
+    @property
+    def line_style(self) -> LineStyle:
+        """The LineStyle for ``style``, resolved on each access."""
+        return STYLE_MAP.get(self.style, LineStyle.DEFAULT)
 
-@dataclass
+
+@dataclass(slots=True)
 class Scene:
     """A complete scene definition."""
 
@@ -92,16 +109,32 @@ class Scene:
 
 # ── Template expansion ────────────────────────────────────────────────────
 
-def expand_templates(text: str, config: RenderConfig) -> str:
-    """Expand {{var}} templates in text."""
+def template_vars(config: RenderConfig) -> dict[str, str]:
+    """Resolve the template variables for one compilation."""
+    return {
+        "workspace": str(config.workspace),
+        "theme": config.theme,
+        "date": datetime.datetime.now().strftime("%Y-%m-%d"),
+    }
+
+
+def expand_templates(
+    text: str,
+    config: RenderConfig,
+    mapping: Optional[dict[str, str]] = None,
+) -> str:
+    """Expand {{var}} templates in text.
+
+    Pass a precomputed ``mapping`` from :func:`template_vars` to avoid
+    re-resolving the variables for every string.
+    """
+    if "{{" not in text:
+        return text
+    if mapping is None:
+        mapping = template_vars(config)
+
     def replacer(match: re.Match) -> str:
-        key = match.group(1)
-        mapping = {
-            "workspace": str(config.workspace),
-            "theme": config.theme,
-            "date": datetime.datetime.now().strftime("%Y-%m-%d"),
-        }
-        return mapping.get(key, match.group(0))
+        return mapping.get(match.group(1), match.group(0))
 
     return TEMPLATE_RE.sub(replacer, text)
 
@@ -126,6 +159,46 @@ def _parse_step(data: dict) -> SceneStep:
     )
 
 
+# Top-level keys a scene file may use; anything else is never constructed
+_SCENE_KEYS = frozenset({"id", "title", "theme", "meta"})
+
+
+def _read_scene_data(path: Path) -> Optional[tuple[dict, list[SceneStep]]]:
+    """Parse a scene file into its top-level fields and steps.
+
+    Works on the composed node tree rather than ``yaml.load``: each step
+    is constructed and turned into a SceneStep one at a time, and unknown
+    top-level sections are skipped instead of materialized. Returns None
+    when the document is not a mapping.
+    """
+    loader = _YamlLoader(path.read_bytes())
+    try:
+        root = loader.get_single_node()
+        if not isinstance(root, yaml.MappingNode):
+            return None
+        loader.flatten_mapping(root)
+
+        fields: dict = {}
+        steps: list[SceneStep] = []
+        for key_node, value_node in root.value:
+            key = loader.construct_object(key_node)
+            if key == "steps":
+                if isinstance(value_node, yaml.SequenceNode):
+                    items = (loader.construct_object(n, deep=True) for n in value_node.value)
+                else:
+                    items = loader.construct_object(value_node, deep=True) or []
+                steps = [_parse_step(item) for item in items]
+            elif key in _SCENE_KEYS:
+                fields[key] = loader.construct_object(value_node, deep=True)
+        return fields, steps
+    finally:
+        loader.dispose()
+
+
+# Parsed scenes keyed by (resolved path, mtime); edits invalidate naturally
+_SCENE_CACHE: dict[tuple[Path, int], Scene] = {}
+
+
 def load_scene(name_or_path: str, scenes_dir: Optional[Path] = None) -> Scene:
     """Load a scene from YAML file.
 
@@ -146,19 +219,25 @@ def load_scene(name_or_path: str, scenes_dir: Optional[Path] = None) -> Scene:
             f"Available: {', '.join(available) or 'none'}"
         )
 
-    data = yaml.safe_load(path.read_text())
-    if not isinstance(data, dict):
-        raise ValueError(f"Scene file must be a YAML mapping: {path}")
-
-    steps = [_parse_step(s) for s in data.get("steps", [])]
+    key = (path.resolve(), path.stat().st_mtime_ns)
+    scene = _SCENE_CACHE.get(key)
+    if scene is None:
+        parsed = _read_scene_data(path)
+        if parsed is None:
+            raise ValueError(f"Scene file must be a YAML mapping: {path}")
+
+        data, steps = parsed
+        scene = Scene(
+            id=data.get("id", path.stem),
+            title=data.get("title", ""),
+            theme=data.get("theme", ""),
+            steps=steps,
+            meta=data.get("meta", {}),
+        )
+        _SCENE_CACHE[key] = scene
 
-    return Scene(
-        id=data.get("id", path.stem),
-        title=data.get("title", ""),
-        theme=data.get("theme", ""),
-        steps=steps,
-        meta=data.get("meta", {}),
-    )
+    # Callers may adjust the scene, so never hand out the cached instance
+    return copy.deepcopy(scene)
 
 
 def list_scenes(scenes_dir: Optional[Path] = None) -> list[str]:
@@ -182,6 +261,16 @@ STYLE_MAP: dict[str, LineStyle] = {
 }
 
 
+# Compiled timelines, oldest first; see compile_scene
+_COMPILE_CACHE: dict[tuple, Timeline] = {}
+_COMPILE_CACHE_SIZE = 16
+
+
+def clear_compile_cache() -> None:
+    """Drop all memoized compile_scene results."""
+    _COMPILE_CACHE.clear()
+
+
 def compile_scene(
     scene: Scene,
     config: RenderConfig,
@@ -190,76 +279,137 @@ def compile_scene(
     """Compile a scene definition into a timeline.
 
     Resolves all templates, applies preset timing, and generates
-    the full event sequence.
+    the full event sequence. Results are memoized on the scene contents,
+    preset, template variables and speed; each call returns a copy.
     """
     preset = preset or get_preset(config.preset)
+    # Resolved once so {{date}} is stable across the whole scene
+    variables = template_vars(config)
+    key = (repr(scene), preset, tuple(variables.items()), config.speed)
+    cached = _COMPILE_CACHE.get(key)
+    if cached is None:
+        cached = _compile(scene, preset, config, variables)
+        if len(_COMPILE_CACHE) >= _COMPILE_CACHE_SIZE:
+            del _COMPILE_CACHE[next(iter(_COMPILE_CACHE))]
+        _COMPILE_CACHE[key] = cached
+    return cached.copy()
+
+
+@dataclass(slots=True)
+class _CompileState:
+    """Per-compilation values shared by the step handlers."""
+
+    timeline: Timeline
+    scene: Scene
+    preset: Preset
+    config: RenderConfig
+    variables: dict[str, str]
+
+    def expand(self, text: str) -> str:
+        return expand_templates(text, self.config, self.variables)
+
+
+def _compile_banner(step: SceneStep, st: _CompileState, cursor_ms: float) -> float:
+    banner_name = step.banner_name
+    if banner_name and banner_name in BANNERS:
+        text = BANNERS[banner_name]
+        if _BANNER_HAS_TEMPLATE[banner_name]:
+            text = st.expand(text)
+    else:
+        text = step.text
+        if not text and st.scene.title:
+            text = st.scene.title
+        text = st.expand(text)
+
+    st.timeline.add_banner(cursor_ms, text, scene=st.scene.id)
+    return cursor_ms + st.preset.banner_hold_ms
+
+
+def _compile_command(step: SceneStep, st: _CompileState, cursor_ms: float) -> float:
+    timeline, scene_id = st.timeline, st.scene.id
+    timeline.add_command(cursor_ms, f"❯ {st.expand(step.text)}", scene=scene_id)
+    cursor_ms += st.preset.command_hold_ms
+
+    # Output lines
+    style = step.line_style
+    output_ms = st.preset.command_output_ms
+    for out_line in step.output:
+        timeline.add_line(cursor_ms, st.expand(out_line), style=style, scene=scene_id)
+        cursor_ms += output_ms
+
+    return cursor_ms + st.preset.line_hold_ms
+
+
+def _compile_spinner(step: SceneStep, st: _CompileState, cursor_ms: float) -> float:
+    cycles = step.cycles if step.cycles > 0 else st.preset.spinner_cycles
+    cursor_ms = st.timeline.add_spinner(
+        cursor_ms,
+        st.expand(step.label or step.text),
+        frames=SPINNER_FRAMES,
+        cycle_ms=st.preset.spinner_cycle_ms,
+        cycles=cycles,
+    )
+    return cursor_ms + st.preset.line_hold_ms
+
+
+def _compile_progress(step: SceneStep, st: _CompileState, cursor_ms: float) -> float:
+    width = step.width if step.width > 0 else 26
+    cursor_ms = st.timeline.add_progress(
+        cursor_ms,
+        st.expand(step.label or step.text),
+        width=width,
+        step_ms=st.preset.progress_step_ms,
+    )
+    return cursor_ms + st.preset.line_hold_ms
+
+
+def _compile_line(step: SceneStep, st: _CompileState, cursor_ms: float) -> float:
+    st.timeline.add_line(
+        cursor_ms, st.expand(step.text), style=step.line_style, scene=st.scene.id
+    )
+    return cursor_ms + st.preset.line_hold_ms
+
+
+def _compile_transition(step: SceneStep, st: _CompileState, cursor_ms: float) -> float:
+    duration = step.duration_ms or st.preset.transition_ms
+    return st.timeline.add_transition(
+        cursor_ms, style=step.transition, duration_ms=duration
+    )
+
+
+def _compile_pause(step: SceneStep, st: _CompileState, cursor_ms: float) -> float:
+    return st.timeline.add_pause(cursor_ms, step.duration_ms or st.preset.pause_ms)
+
+
+# Step type → handler that emits its events and returns the new cursor time.
+# Unknown step types are ignored.
+_STEP_HANDLERS: dict[str, Callable[[SceneStep, _CompileState, float], float]] = {
+    "banner": _compile_banner,
+    "command": _compile_command,
+    "spinner": _compile_spinner,
+    "progress": _compile_progress,
+    "line": _compile_line,
+    "transition": _compile_transition,
+    "pause": _compile_pause,
+}
+
+
+def _compile(
+    scene: Scene,
+    preset: Preset,
+    config: RenderConfig,
+    variables: dict[str, str],
+) -> Timeline:
+    """Uncached body of compile_scene."""
     timeline = Timeline()
+    state = _CompileState(timeline, scene, preset, config, variables)
     cursor_ms = float(preset.intro_hold_ms)
 
+    handlers = _STEP_HANDLERS
     for step in scene.steps:
-        if step.step_type == "banner":
-            text = step.text
-            if step.banner_name and step.banner_name in BANNERS:
-                text = BANNERS[step.banner_name]
-            elif not text and scene.title:
-                text = scene.title
-
-            text = expand_templates(text, config)
-            timeline.add_banner(cursor_ms, text, scene=scene.id)
-            cursor_ms += preset.banner_hold_ms
-
-        elif step.step_type == "command":
-            cmd_text = expand_templates(step.text, config)
-            timeline.add_command(cursor_ms, f"❯ {cmd_text}", scene=scene.id)
-            cursor_ms += preset.command_hold_ms
-
-            # Output lines
-            for out_line in step.output:
-                out_line = expand_templates(out_line, config)
-                style = STYLE_MAP.get(step.style, LineStyle.DEFAULT)
-                timeline.add_line(cursor_ms, out_line, style=style, scene=scene.id)
-                cursor_ms += preset.command_output_ms
-
-            cursor_ms += preset.line_hold_ms
-
-        elif step.step_type == "spinner":
-            label = expand_templates(step.label or step.text, config)
-            cycles = step.cycles if step.cycles > 0 else preset.spinner_cycles
-            cursor_ms = timeline.add_spinner(
-                cursor_ms,
-                label,
-                frames=SPINNER_FRAMES,
-                cycle_ms=preset.spinner_cycle_ms,
-                cycles=cycles,
-            )
-            cursor_ms += preset.line_hold_ms
-
-        elif step.step_type == "progress":
-            label = expand_templates(step.label or step.text, config)
-            width = step.width if step.width > 0 else 26
-            cursor_ms = timeline.add_progress(
-                cursor_ms,
-                label,
-                width=width,
-                step_ms=preset.progress_step_ms,
-            )
-            cursor_ms += preset.line_hold_ms
-
-        elif step.step_type == "line":
-            text = expand_templates(step.text, config)
-            style = STYLE_MAP.get(step.style, LineStyle.DEFAULT)
-            timeline.add_line(cursor_ms, text, style=style, scene=scene.id)
-            cursor_ms += preset.line_hold_ms
-
-        elif step.step_type == "transition":
-            duration = step.duration_ms or preset.transition_ms
-            cursor_ms = timeline.add_transition(
-                cursor_ms, style=step.transition, duration_ms=duration
-            )
-
-        elif step.step_type == "pause":
-            duration = step.duration_ms or preset.pause_ms
-            cursor_ms = timeline.add_pause(cursor_ms, duration)
+        handler = handlers.get(step.step_type)
+        if handler is not None:
+            cursor_ms = handler(step, state, cursor_ms)
 
     # Outro hold
     cursor_ms = timeline.add_pause(cursor_ms, preset.outro_hold_ms)
@@ -300,7 +450,7 @@ def generate_default_scene(config: RenderConfig) -> Scene:
         SceneStep(step_type="line", text=title, style="accent"),
         SceneStep(step_type="line", text=f"theme: {theme}", style="dim"),
         SceneStep(step_type="line", text="workspace: {{workspace}}", style="dim"),
-        SceneStep(step_type="line", text="━" * 60, style="dim"),
+        SceneStep(step_type="line", text=_HR, style="dim"),
         SceneStep(step_type="pause", duration_ms=200),
         # File listing
         SceneStep(
@@ -383,7 +533,7 @@ def generate_default_scene(config: RenderConfig) -> Scene:
             ],
         ),
         # Outro
-        SceneStep(step_type="line", text="━" * 60, style="dim"),
+        SceneStep(step_type="line", text=_HR, style="dim"),
         SceneStep(step_type="line", text=">> Demo complete.", style="success"),
         SceneStep(
             step_type="line",
@@ -11,9 +11,13 @@ Handles:
 from __future__ import annotations
 
 import re
+import weakref
+from array import array, typecodes
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
 
 
 class AnsiMode(Enum):
@@ -23,23 +27,94 @@ class AnsiMode(Enum):
     STRIP = "strip"
 
 
-# Regex to match ANSI escape sequences
-ANSI_RE = re.compile(r"\x1b\[[0-9;]*[A-Za-z]|\x1b\].*?\x07|\x1b[()][AB012]")
+# Regex to match ANSI escape sequences (``strip_ansi`` scans the same grammar)
+ANSI_RE = re.compile(r"\x1b\[[0-?]*[@-~]|\x1b\].*?\x07|\x1b[()][AB012]")
+
+
+# Tokens of a terminal stream, in priority order: CSI sequences, other
+# escapes with no visible effect, cursor-moving controls, printable runs
+TOKEN_RE = re.compile(
+    r"(?P<csi>\x1b\[[0-9;?]*[A-Za-z])"
+    r"|(?P<other>\x1b\].*?\x07|\x1b[()][AB012])"
+    r"|(?P<ctrl>[\r\n\b\t])"
+    r"|(?P<text>[^\x00-\x1f\x7f]+)"
+)
+
+
+def _escape_end(text: str, start: int) -> int:
+    """Index just past the escape sequence at ``text[start]``, or -1.
+
+    CSI takes parameter bytes 0x30-0x3F and one final byte 0x40-0x7E; OSC
+    runs to BEL on the same line; charset selection is ``ESC ( X``.
+    """
+    n = len(text)
+    k = start + 1
+    if k >= n:
+        return -1
+    kind = text[k]
+    if kind == "[":
+        k += 1
+        while k < n and "0" <= text[k] <= "?":
+            k += 1
+        if k < n and "@" <= text[k] <= "~":
+            return k + 1
+    elif kind == "]":
+        bel = text.find("\x07", k + 1)
+        if bel >= 0 and text.find("\n", k + 1, bel) < 0:
+            return bel + 1
+    elif kind in "()":
+        if k + 1 < n and text[k + 1] in "AB012":
+            return k + 2
+    return -1
+
+
+# CSI and charset selection only; none of these can backtrack
+_CSI_RE = re.compile(r"\x1b\[[0-?]*[@-~]|\x1b[()][AB012]")
 
 
 def strip_ansi(text: str) -> str:
-    """Remove all ANSI escape sequences from text."""
-    return ANSI_RE.sub("", text)
+    """Remove all ANSI escape sequences from text.
+
+    Plain text is returned as-is. OSC sequences are located with
+    ``str.find`` instead of the lazy ``.*?`` regex, which rescans to the
+    end of the string for every unterminated ``ESC ]``. A lone ESC that
+    starts no recognised sequence is kept.
+    """
+    i = text.find("\x1b")
+    if i < 0:
+        return text
+    if "\x1b]" not in text:
+        return _CSI_RE.sub("", text)
+    out = [text[:i]]
+    while i >= 0:
+        end = _escape_end(text, i)
+        if end < 0:
+            out.append("\x1b")
+            end = i + 1
+        i = text.find("\x1b", end)
+        out.append(text[end:] if i < 0 else text[end:i])
+    return "".join(out)
 
 
 def visible_len(text: str) -> int:
-    """Length of text excluding ANSI escape codes."""
+    """Length of text excluding ANSI escape codes.
+
+    Without OSC sequences the matched escapes are measured and subtracted,
+    so the stripped string is never built.
+    """
+    if "\x1b" not in text:
+        return len(text)
+    if "\x1b]" not in text:
+        return len(text) - sum(map(len, _CSI_RE.findall(text)))
     return len(strip_ansi(text))
 
 
-@dataclass
+@dataclass(frozen=True, slots=True, weakref_slot=True)
 class StyledChar:
-    """A single character with style information."""
+    """A single character with style information.
+
+    Instances are immutable so identical cells can be shared.
+    """
 
     char: str = " "
     fg: Optional[str] = None
@@ -52,38 +127,123 @@ class StyledChar:
         return self.char
 
 
-@dataclass
+# Attribute bits packed into ``TerminalLine.attrs``
+ATTR_BOLD = 1
+ATTR_DIM = 2
+ATTR_UNDERLINE = 4
+
+# Unicode array typecode for line characters: "w" (UCS-4) where available,
+# else the older wchar-based "u"
+_CHAR_TYPECODE = "w" if "w" in typecodes else "u"
+
+# Live StyledChar per (char, fg, bg, attr bits); entries drop out once no
+# materialized line references them
+_CELL_INTERN: weakref.WeakValueDictionary[tuple, StyledChar] = weakref.WeakValueDictionary()
+_BLANK = StyledChar()
+
+
+def _intern_cell(char: str, fg: Optional[str], bg: Optional[str], attr: int) -> StyledChar:
+    """Shared StyledChar for a cell's contents."""
+    if char == " " and fg is None and bg is None and not attr:
+        return _BLANK
+    key = (char, fg, bg, attr)
+    cell = _CELL_INTERN.get(key)
+    if cell is None:
+        cell = StyledChar(
+            char=char, fg=fg, bg=bg,
+            bold=bool(attr & ATTR_BOLD),
+            dim=bool(attr & ATTR_DIM),
+            underline=bool(attr & ATTR_UNDERLINE),
+        )
+        _CELL_INTERN[key] = cell
+    return cell
+
+
+@dataclass(slots=True)
 class TerminalLine:
-    """A single terminal line as a list of styled characters."""
+    """A single terminal line stored as parallel per-column buffers.
+
+    Characters, colours and packed attribute bits are kept in separate
+    flat sequences instead of one ``StyledChar`` object per column;
+    ``cells`` materializes StyledChars on demand. Characters are a unicode
+    ``array`` so ``to_plain`` is a single C-level conversion.
+    """
 
-    cells: list[StyledChar] = field(default_factory=list)
     width: int = 120
+    chars: array = field(default_factory=lambda: array(_CHAR_TYPECODE))
+    fg: list[Optional[str]] = field(default_factory=list)
+    bg: list[Optional[str]] = field(default_factory=list)
+    attrs: bytearray = field(default_factory=bytearray)
 
     def __post_init__(self) -> None:
-        if not self.cells:
-            self.cells = [StyledChar() for _ in range(self.width)]
+        if not self.chars:
+            self.clear()
+
+    @property
+    def cells(self) -> list[StyledChar]:
+        """The line as StyledChar objects (a snapshot, not a live view).
+
+        Identical cells are the same interned instance.
+        """
+        return list(map(_intern_cell, self.chars, self.fg, self.bg, self.attrs))
 
     def set_char(self, col: int, char: str, style: Optional[dict] = None) -> None:
         """Set character at column with optional style."""
         if 0 <= col < self.width:
-            sc = StyledChar(char=char)
-            if style:
-                sc.fg = style.get("fg")
-                sc.bg = style.get("bg")
-                sc.bold = style.get("bold", False)
-                sc.dim = style.get("dim", False)
-            self.cells[col] = sc
+            self.write_run(col, char, *_style_fields(style))
+
+    def write_run(
+        self,
+        col: int,
+        text: str,
+        fg: Optional[str] = None,
+        bg: Optional[str] = None,
+        attr: int = 0,
+    ) -> None:
+        """Write ``text`` starting at ``col`` in one style; caller ensures it fits."""
+        end = col + len(text)
+        self.chars[col:end] = array(_CHAR_TYPECODE, text)
+        self.fg[col:end] = [fg] * len(text)
+        self.bg[col:end] = [bg] * len(text)
+        self.attrs[col:end] = bytes((attr,)) * len(text)
+
+    def erase(self, start: int, end: int) -> None:
+        """Blank columns ``start`` to ``end`` (exclusive) in the default style."""
+        start, end = max(0, start), min(self.width, end)
+        if start < end:
+            self.write_run(start, " " * (end - start))
 
     def to_plain(self) -> str:
         """Return plain text content, right-stripped."""
-        return "".join(c.char for c in self.cells).rstrip()
+        return self.chars.tounicode().rstrip()
 
     def clear(self) -> None:
         """Clear the line."""
-        self.cells = [StyledChar() for _ in range(self.width)]
+        self.chars = array(_CHAR_TYPECODE, " " * self.width)
+        self.fg = [None] * self.width
+        self.bg = [None] * self.width
+        self.attrs = bytearray(self.width)
+
+    def copy(self) -> TerminalLine:
+        """Independent copy of the line's buffers."""
+        return TerminalLine(
+            width=self.width,
+            chars=self.chars[:],
+            fg=self.fg.copy(),
+            bg=self.bg.copy(),
+            attrs=self.attrs.copy(),
+        )
+
 
+def _style_fields(style: Optional[Mapping[str, Any]]) -> tuple[Optional[str], Optional[str], int]:
+    """Split a style dict into the (fg, bg, attr bits) a line stores."""
+    if not style:
+        return None, None, 0
+    attr = (ATTR_BOLD if style.get("bold") else 0) | (ATTR_DIM if style.get("dim") else 0)
+    return style.get("fg"), style.get("bg"), attr
 
-@dataclass
+
+@dataclass(slots=True)
 class ScreenSnapshot:
     """A frozen snapshot of the terminal screen at a point in time."""
 
@@ -92,6 +252,7 @@ class ScreenSnapshot:
     cursor_row: int
     cursor_col: int
     t_ms: float = 0.0
+    nonempty_text: str = ""  # Non-blank lines joined by newlines
 
     def to_text(self) -> str:
         """Render as plain text."""
@@ -110,18 +271,32 @@ _BASIC_FG = {
 }
 
 
-def _parse_sgr_params(params_str: str) -> dict:
-    """Parse SGR parameters into a style dict delta."""
+@lru_cache(maxsize=512)
+def _parse_sgr_params(params_str: str) -> tuple[bool, Mapping[str, Any]]:
+    """Parse SGR parameters into ``(reset, delta)``.
+
+    ``reset`` says the current style is cleared before ``delta`` is
+    applied. Programs emit the same few sequences over and over, so
+    parsed results are cached per parameter string and returned read-only.
+    """
+    reset, delta = _sgr_delta(params_str)
+    return reset, MappingProxyType(delta)
+
+
+def _sgr_delta(params_str: str) -> tuple[bool, dict]:
     style: dict = {}
     if not params_str:
-        return {"reset": True}
+        return True, style
+    reset = False
 
     codes = [int(c) if c else 0 for c in params_str.split(";")]
     i = 0
     while i < len(codes):
         c = codes[i]
         if c == 0:
-            style["reset"] = True
+            # Codes before a reset in the same sequence have no effect
+            style.clear()
+            reset = True
         elif c == 1:
             style["bold"] = True
         elif c == 2:
@@ -158,13 +333,13 @@ def _parse_sgr_params(params_str: str) -> dict:
                 style["bg"] = f"#{r:02x}{g:02x}{b:02x}"
                 i += 4
         i += 1
-    return style
+    return reset, style
 
 
 class TerminalParser:
     """Stateful terminal stream parser.
 
-    Processes raw terminal output character-by-character, tracking:
+    Processes raw terminal output token by token, tracking:
     - Cursor position (row, col)
     - Screen buffer (rows x cols)
     - ANSI style state
@@ -187,90 +362,119 @@ class TerminalParser:
         self.cols = cols
         self.ansi_mode = ansi_mode
 
-        # Screen buffer
-        self.screen: list[TerminalLine] = [
+        # Screen buffer as a ring: logical row r lives at physical index
+        # (self._top + r) % rows, so scrolling just advances _top
+        self._lines: list[TerminalLine] = [
             TerminalLine(width=cols) for _ in range(rows)
         ]
+        self._top = 0
 
         # Cursor position
         self.cursor_row = 0
         self.cursor_col = 0
 
-        # Current style state
+        # Current style state, and the (fg, bg, attr bits) it writes with;
+        # the latter only changes on SGR so runs don't re-derive it
         self._style: dict = {}
+        self._pen: tuple[Optional[str], Optional[str], int] = (None, None, 0)
 
         # Scroll offset (for tracking total lines scrolled)
         self._scroll_count = 0
 
+        # Physical rows changed since the last snapshot; clean rows reuse
+        # the previous snapshot's plain text and line copy
+        self._dirty: set[int] = set(range(rows))
+        self._last_plain: list[str] = [""] * rows
+        self._last_styled: list[Optional[TerminalLine]] = [None] * rows
+
+    @property
+    def screen(self) -> list[TerminalLine]:
+        """Screen lines in display order, top row first."""
+        top = self._top
+        return self._lines[top:] + self._lines[:top]
+
     def feed(self, data: str) -> None:
-        """Process a chunk of terminal output."""
-        i = 0
-        while i < len(data):
-            ch = data[i]
-
-            # Check for ANSI escape sequence
-            if ch == "\x1b" and i + 1 < len(data) and data[i + 1] == "[":
-                # Find end of sequence
-                j = i + 2
-                while j < len(data) and data[j] not in "ABCDEFGHJKSTfmnsu":
-                    j += 1
-                if j < len(data):
-                    seq = data[i : j + 1]
-                    self._handle_escape(seq)
-                    i = j + 1
-                    continue
+        """Process a chunk of terminal output.
+
+        Input is tokenized by ``TOKEN_RE`` and dispatched per token, so a
+        run of printable text is written in one step. Bytes no token
+        matches (stray ESC, other C0 controls) are dropped.
+        """
+        if data.isprintable():
+            # No controls or escapes at all: a single run (or nothing)
+            if data:
+                self._put_run(data)
+            return
+        for m in TOKEN_RE.finditer(data):
+            kind = m.lastgroup
+            if kind == "text":
+                self._put_run(m.group())
+            elif kind == "csi":
+                self._handle_escape(m.group())
+            elif kind == "ctrl":
+                ch = m.group()
+                if ch == "\r":
+                    self.cursor_col = 0
+                elif ch == "\n":
+                    self._line_feed()
+                elif ch == "\b":
+                    if self.cursor_col > 0:
+                        self.cursor_col -= 1
                 else:
-                    i += 1
-                    continue
-
-            # Regular character handling
-            if ch == "\r":
-                self.cursor_col = 0
-            elif ch == "\n":
+                    # Tab to next 8-column stop
+                    next_stop = ((self.cursor_col // 8) + 1) * 8
+                    self.cursor_col = min(next_stop, self.cols - 1)
+            # "other" (OSC titles, charset selection) has no visible effect
+
+    def _put_run(self, text: str) -> None:
+        """Write a run of printable characters, wrapping at the right edge."""
+        fg, bg, attr = self._pen
+        col = self.cursor_col
+        if len(text) <= self.cols - col:
+            # Common case: the run fits on the current line, no wrap checks
+            row = (self._top + self.cursor_row) % self.rows
+            self._lines[row].write_run(col, text, fg, bg, attr)
+            self._dirty.add(row)
+            self.cursor_col = col + len(text)
+            return
+        while text:
+            # Deferred (VT100) wrap: filling the last column leaves the
+            # cursor at the margin, and only the next printable wraps, so
+            # an exact-width line followed by CR or LF never scrolls twice
+            if self.cursor_col >= self.cols:
                 self._line_feed()
-            elif ch == "\b":
-                if self.cursor_col > 0:
-                    self.cursor_col -= 1
-            elif ch == "\t":
-                # Tab to next 8-column stop
-                next_stop = ((self.cursor_col // 8) + 1) * 8
-                self.cursor_col = min(next_stop, self.cols - 1)
-            elif ord(ch) >= 32:  # Printable character
-                self._put_char(ch)
-            i += 1
-
-    def _put_char(self, ch: str) -> None:
-        """Place a character at the current cursor position."""
-        if self.cursor_col >= self.cols:
-            self._line_feed()
-            self.cursor_col = 0
-
-        self.screen[self.cursor_row].set_char(
-            self.cursor_col, ch, self._style if self._style else None
-        )
-        self.cursor_col += 1
+                self.cursor_col = 0
+            col = self.cursor_col
+            n = min(len(text), self.cols - col)
+            row = (self._top + self.cursor_row) % self.rows
+            self._lines[row].write_run(col, text[:n], fg, bg, attr)
+            self._dirty.add(row)
+            self.cursor_col = col + n
+            text = text[n:]
 
     def _line_feed(self) -> None:
         """Move cursor down, scrolling if at bottom."""
         if self.cursor_row < self.rows - 1:
             self.cursor_row += 1
         else:
-            # Scroll: remove top line, add blank at bottom
-            self.screen.pop(0)
-            self.screen.append(TerminalLine(width=self.cols))
+            # Scroll: the top line is blanked and becomes the bottom one
+            old_top = self._top
+            self._lines[old_top].clear()
+            self._dirty.add(old_top)
+            self._top = (old_top + 1) % self.rows
             self._scroll_count += 1
         self.cursor_col = 0
 
     def _handle_escape(self, seq: str) -> None:
         """Handle an ANSI escape sequence."""
         # SGR (Select Graphic Rendition) - color/style
-        m = SGR_RE.match(seq)
-        if m:
-            params = _parse_sgr_params(m.group(1))
-            if params.get("reset"):
-                self._style = {}
+        if seq[-1] == "m" and seq[1] == "[" and "?" not in seq:
+            reset, delta = _parse_sgr_params(seq[2:-1])
+            if reset:
+                self._style = dict(delta)
             else:
-                self._style.update(params)
+                self._style.update(delta)
+            self._pen = _style_fields(self._style)
             return
 
         # Cursor movement sequences
@@ -295,60 +499,71 @@ class TerminalParser:
         elif cmd == "D":  # Cursor back
             self.cursor_col = max(0, self.cursor_col - n)
         elif cmd == "K":  # Erase in line
+            row = (self._top + self.cursor_row) % self.rows
+            self._dirty.add(row)
             mode = n if param_str else 0
             if mode == 0:
                 # Clear from cursor to end of line
-                for c in range(self.cursor_col, self.cols):
-                    self.screen[self.cursor_row].set_char(c, " ")
+                self._lines[row].erase(self.cursor_col, self.cols)
             elif mode == 1:
                 # Clear from start to cursor
-                for c in range(self.cursor_col + 1):
-                    self.screen[self.cursor_row].set_char(c, " ")
+                self._lines[row].erase(0, self.cursor_col + 1)
             elif mode == 2:
                 # Clear entire line
-                self.screen[self.cursor_row].clear()
+                self._lines[row].clear()
         elif cmd == "J":  # Erase in display
             mode = n if param_str else 0
             if mode == 0:
                 # Clear from cursor to end
-                for c in range(self.cursor_col, self.cols):
-                    self.screen[self.cursor_row].set_char(c, " ")
+                row = (self._top + self.cursor_row) % self.rows
+                self._lines[row].erase(self.cursor_col, self.cols)
+                self._dirty.add(row)
                 for r in range(self.cursor_row + 1, self.rows):
-                    self.screen[r].clear()
+                    row = (self._top + r) % self.rows
+                    self._lines[row].clear()
+                    self._dirty.add(row)
             elif mode == 2:
                 # Clear entire screen
-                for r in range(self.rows):
-                    self.screen[r].clear()
+                for line in self._lines:
+                    line.clear()
+                self._dirty.update(range(self.rows))
                 self.cursor_row = 0
                 self.cursor_col = 0
 
     def snapshot(self, t_ms: float = 0.0) -> ScreenSnapshot:
-        """Capture the current screen state as a frozen snapshot."""
-        lines = [line.to_plain() for line in self.screen]
-        styled = [
-            TerminalLine(
-                cells=[
-                    StyledChar(
-                        char=c.char, fg=c.fg, bg=c.bg, bold=c.bold, dim=c.dim
-                    )
-                    for c in line.cells
-                ],
-                width=line.width,
-            )
-            for line in self.screen
-        ]
+        """Capture the current screen state as a frozen snapshot.
+
+        Only rows changed since the previous call are re-copied; the
+        returned lines must be treated as read-only.
+        """
+        for r in self._dirty:
+            line = self._lines[r]
+            self._last_plain[r] = line.to_plain()
+            self._last_styled[r] = line.copy()
+        self._dirty.clear()
+
+        top = self._top
+        lines = self._last_plain[top:] + self._last_plain[:top]
+        # Lines are right-stripped, so blank rows are exactly ""
+        nonempty_text = "\n".join([line for line in lines if line])
+        # Unchanged rows share their TerminalLine with earlier snapshots
+        styled = self._last_styled[top:] + self._last_styled[:top]
         return ScreenSnapshot(
             lines=lines,
             styled_lines=styled,
             cursor_row=self.cursor_row,
             cursor_col=self.cursor_col,
             t_ms=t_ms,
+            nonempty_text=nonempty_text,
         )
 
     def reset(self) -> None:
         """Reset the terminal to blank state."""
-        self.screen = [TerminalLine(width=self.cols) for _ in range(self.rows)]
+        self._lines = [TerminalLine(width=self.cols) for _ in range(self.rows)]
+        self._top = 0
         self.cursor_row = 0
         self.cursor_col = 0
         self._style = {}
+        self._pen = (None, None, 0)
         self._scroll_count = 0
+        self._dirty = set(range(self.rows))
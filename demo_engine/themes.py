@@ -8,18 +8,26 @@ Themes are JSON files in the themes/ directory that define:
 
 from __future__ import annotations
 
+import copy
 import json
-from dataclasses import dataclass, field
+import os
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 from typing import Any, Optional
 
+try:
+    # Optional C decoder; its errors subclass json.JSONDecodeError
+    from orjson import loads as _loads
+except ImportError:  # pragma: no cover - depends on installed extras
+    from json import loads as _loads
+
 from demo_engine.config import THEMES_DIR
 
 
 # ── Schema for validation ─────────────────────────────────────────────────
 
-REQUIRED_COLORS = {"bg", "text", "cmd", "success", "warn", "accent"}
-OPTIONAL_COLORS = {"panel", "header", "error", "dim", "cursor", "border"}
+REQUIRED_COLORS = frozenset({"bg", "text", "cmd", "success", "warn", "accent"})
+OPTIONAL_COLORS = frozenset({"panel", "header", "error", "dim", "cursor", "border"})
 ALL_COLORS = REQUIRED_COLORS | OPTIONAL_COLORS
 
 EFFECT_KEYS = {
@@ -39,7 +47,7 @@ class ThemeError(Exception):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class ThemeColors:
     """Theme color palette."""
 
@@ -57,7 +65,7 @@ class ThemeColors:
     border: str = "#333333"
 
 
-@dataclass
+@dataclass(slots=True)
 class ThemeEffects:
     """Theme effect configuration."""
 
@@ -70,7 +78,7 @@ class ThemeEffects:
     chromatic_aberration: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class Theme:
     """A fully resolved theme."""
 
@@ -96,9 +104,9 @@ def validate_theme_data(data: dict, source: str = "<unknown>") -> list[str]:
         errors.append(f"{source}: missing required field 'id'")
 
     colors = data.get("colors", {})
-    for key in REQUIRED_COLORS:
-        if key not in colors:
-            errors.append(f"{source}: missing required color '{key}'")
+    # One C-level set difference; sorted so messages come out in a stable order
+    for key in sorted(REQUIRED_COLORS - colors.keys()):
+        errors.append(f"{source}: missing required color '{key}'")
 
     for key, val in colors.items():
         if key not in ALL_COLORS:
@@ -140,33 +148,76 @@ def load_theme_from_dict(data: dict) -> Theme:
     )
 
 
+# Registry of validated themes keyed by (file, mtime); invalid files are
+# never cached so their errors resurface on every load
+_THEME_REGISTRY: dict[tuple[Path, int], Theme] = {}
+# Theme names per directory, keyed by (directory, mtime)
+_THEME_LISTINGS: dict[tuple[Path, int], list[str]] = {}
+
+
 def load_theme(name: str, themes_dir: Optional[Path] = None) -> Theme:
-    """Load a theme by name from the themes directory."""
+    """Load a theme by name from the themes directory.
+
+    Each file is parsed and validated once per modification; callers get
+    their own copy of the registered theme.
+    """
     themes_dir = themes_dir or THEMES_DIR
     path = themes_dir / f"{name}.json"
 
-    if not path.exists():
+    try:
+        key = (path, path.stat().st_mtime_ns)
+    except OSError:
         available = list_themes(themes_dir)
         raise ThemeError(
             f"Theme '{name}' not found at {path}. "
             f"Available: {', '.join(available) or 'none'}"
-        )
+        ) from None
 
-    try:
-        data = json.loads(path.read_text())
-    except json.JSONDecodeError as e:
-        raise ThemeError(f"Invalid JSON in {path}: {e}") from e
+    theme = _THEME_REGISTRY.get(key)
+    if theme is None:
+        try:
+            data = _loads(path.read_bytes())
+        except json.JSONDecodeError as e:
+            raise ThemeError(f"Invalid JSON in {path}: {e}") from e
+
+        errors = validate_theme_data(data, source=str(path))
+        if errors:
+            raise ThemeError("Theme validation failed:\n  " + "\n  ".join(errors))
 
-    errors = validate_theme_data(data, source=str(path))
-    if errors:
-        raise ThemeError("Theme validation failed:\n  " + "\n  ".join(errors))
+        theme = _THEME_REGISTRY[key] = load_theme_from_dict(data)
 
-    return load_theme_from_dict(data)
+    return _copy_theme(theme)
+
+
+def _copy_theme(theme: Theme) -> Theme:
+    """Copy a registered theme field by field.
+
+    The palette and effects hold only immutable values, so shallow copies
+    suffice; only the free-form ``meta`` needs a deep copy.
+    """
+    return Theme(
+        id=theme.id,
+        name=theme.name,
+        colors=replace(theme.colors),
+        effects=replace(theme.effects),
+        glyph_map=dict(theme.glyph_map),
+        meta=copy.deepcopy(theme.meta) if theme.meta else {},
+    )
 
 
 def list_themes(themes_dir: Optional[Path] = None) -> list[str]:
     """List available theme names."""
     themes_dir = themes_dir or THEMES_DIR
-    if not themes_dir.exists():
+    try:
+        key = (themes_dir, themes_dir.stat().st_mtime_ns)
+    except OSError:
         return []
-    return sorted(p.stem for p in themes_dir.glob("*.json"))
+    names = _THEME_LISTINGS.get(key)
+    if names is None:
+        with os.scandir(themes_dir) as entries:
+            names = sorted(
+                e.name[:-5] for e in entries
+                if e.name.endswith(".json") and e.is_file()
+            )
+        _THEME_LISTINGS[key] = names
+    return list(names)
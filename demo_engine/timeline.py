@@ -8,9 +8,13 @@ All timing is in milliseconds. Events are ordered chronologically.
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from array import array
+from bisect import bisect_left
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from operator import attrgetter
 from enum import Enum
-from typing import Any, Optional
+from typing import Any, Optional, Sequence
 
 
 class EventType(Enum):
@@ -42,17 +46,22 @@ class LineStyle(Enum):
     BANNER = "banner"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TimelineEvent:
     """A single event in the demo timeline.
 
+    Events are immutable, so a timeline can hand out its events (and
+    cache them) without callers being able to desync its bookkeeping;
+    derive changed events with ``dataclasses.replace``.
+
     Attributes:
         t_ms: Absolute timestamp in milliseconds.
         event_type: The type of event.
         text: Text content (if applicable).
         style: Visual style hint.
         row: Target row for overwrites (spinner/progress).
-        meta: Arbitrary metadata (scene name, step index, etc.).
+        meta: Arbitrary metadata (scene name, step index, etc.), or None
+            when there is none; ``get_meta`` always returns a dict.
         duration_ms: Duration for events that span time (pause, transition).
     """
 
@@ -61,9 +70,13 @@ class TimelineEvent:
     text: str = ""
     style: LineStyle = LineStyle.DEFAULT
     row: Optional[int] = None
-    meta: dict[str, Any] = field(default_factory=dict)
+    meta: Optional[dict[str, Any]] = None
     duration_ms: float = 0.0
 
+    def get_meta(self) -> dict[str, Any]:
+        """Event metadata, empty if none was given."""
+        return self.meta or {}
+
     def to_dict(self) -> dict:
         """Serialize to dict for debugging/export."""
         return {
@@ -72,11 +85,36 @@ class TimelineEvent:
             "text": self.text,
             "style": self.style.value,
             "row": self.row,
-            "meta": self.meta,
+            "meta": self.get_meta(),
             "duration_ms": self.duration_ms,
         }
 
 
+_event_time = attrgetter("t_ms")
+
+
+# Right-aligned "  0%" … "100%" labels
+_PCT_LABELS = tuple(f"{pct:3d}%" for pct in range(101))
+
+
+@lru_cache(maxsize=64)
+def _progress_bars(width: int) -> tuple[tuple[str, int], ...]:
+    """Every ``(bar text, percent)`` step of a progress bar of ``width``."""
+    # Each bar is a width-long window sliding left over filled + empty
+    track = "█" * width + "░" * width
+    bars = []
+    for i in range(width + 1):
+        pct = i * 100 // width
+        bars.append((f"[{track[width - i:2 * width - i]}] {_PCT_LABELS[pct]}", pct))
+    return tuple(bars)
+
+
+@lru_cache(maxsize=64)
+def _spinner_texts(frames: tuple[str, ...], label: str) -> tuple[str, ...]:
+    """Spinner line text for each frame glyph."""
+    return tuple(f"{frame_char} {label}" for frame_char in frames)
+
+
 class Timeline:
     """Ordered sequence of timeline events.
 
@@ -86,10 +124,58 @@ class Timeline:
 
     def __init__(self) -> None:
         self._events: list[TimelineEvent] = []
+        # t_ms of each event, parallel to _events, for bisecting without
+        # touching the event objects
+        self._times = array("d")
+        # Distinct characters across all event text, kept up to date by add()
+        self.charset: set[str] = set()
+        # False once an event is added earlier than the one before it
+        self._is_sorted = True
+        # Latest t_ms + duration_ms over all events, or None when empty
+        self._end_ms: Optional[float] = None
+        # One shared instance per distinct event text
+        self._text_pool: dict[str, str] = {}
+        # Cached read-only snapshot for ``events``; reset when order or
+        # membership changes
+        self._events_view: Optional[tuple[TimelineEvent, ...]] = None
 
     def add(self, event: TimelineEvent) -> None:
         """Add an event to the timeline."""
-        self._events.append(event)
+        self.extend((event,))
+
+    def extend(self, new_events: Sequence[TimelineEvent]) -> None:
+        """Add several events, updating the timeline's bookkeeping once."""
+        if not new_events:
+            return
+        new_events = list(new_events)
+        events = self._events
+        prev_ms = events[-1].t_ms if events else new_events[0].t_ms
+        is_sorted = self._is_sorted
+        end_ms = self._end_ms
+        pool = self._text_pool
+        times = self._times
+        for i, event in enumerate(new_events):
+            t = event.t_ms
+            times.append(t)
+            if t < prev_ms:
+                is_sorted = False
+            prev_ms = t
+            end = t + event.duration_ms
+            if end_ms is None or end > end_ms:
+                end_ms = end
+            text = event.text
+            if text:
+                pooled = pool.get(text)
+                if pooled is None:
+                    # First sighting: only new texts can add characters
+                    pool[text] = text
+                    self.charset.update(text)
+                elif pooled is not text:
+                    new_events[i] = replace(event, text=pooled)
+        events.extend(new_events)
+        self._is_sorted = is_sorted
+        self._end_ms = end_ms
+        self._events_view = None
 
     def add_line(
         self,
@@ -99,42 +185,42 @@ class Timeline:
         **meta: Any,
     ) -> float:
         """Add a text line event and return the next timestamp."""
-        self._events.append(
+        self.add(
             TimelineEvent(
                 t_ms=t_ms,
                 event_type=EventType.LINE,
                 text=text,
                 style=style,
-                meta=meta,
+                meta=meta or None,
             )
         )
         return t_ms
 
     def add_command(self, t_ms: float, text: str, **meta: Any) -> float:
         """Add a command event."""
-        self._events.append(
+        self.add(
             TimelineEvent(
                 t_ms=t_ms,
                 event_type=EventType.COMMAND,
                 text=text,
                 style=LineStyle.COMMAND,
-                meta=meta,
+                meta=meta or None,
             )
         )
         return t_ms
 
     def add_banner(self, t_ms: float, text: str, **meta: Any) -> float:
         """Add a banner event."""
-        for i, line in enumerate(text.split("\n")):
-            self._events.append(
-                TimelineEvent(
-                    t_ms=t_ms,
-                    event_type=EventType.BANNER,
-                    text=line,
-                    style=LineStyle.BANNER,
-                    meta={**meta, "banner_line": i},
-                )
+        self.extend([
+            TimelineEvent(
+                t_ms=t_ms,
+                event_type=EventType.BANNER,
+                text=line,
+                style=LineStyle.BANNER,
+                meta={**meta, "banner_line": i},
             )
+            for i, line in enumerate(text.split("\n"))
+        ])
         return t_ms
 
     def add_spinner(
@@ -148,13 +234,14 @@ class Timeline:
     ) -> float:
         """Add spinner animation frames."""
         cursor = t_ms
+        texts = _spinner_texts(tuple(frames), label)
+        new = []
         for i in range(cycles):
-            frame_char = frames[i % len(frames)]
-            self._events.append(
+            new.append(
                 TimelineEvent(
                     t_ms=cursor,
                     event_type=EventType.SPINNER_FRAME,
-                    text=f"{frame_char} {label}",
+                    text=texts[i % len(texts)],
                     style=LineStyle.WARN,
                     row=row,
                     meta={"frame": i, "total": cycles},
@@ -163,7 +250,7 @@ class Timeline:
             cursor += cycle_ms
 
         # Final "done" frame
-        self._events.append(
+        new.append(
             TimelineEvent(
                 t_ms=cursor,
                 event_type=EventType.SPINNER_FRAME,
@@ -173,6 +260,7 @@ class Timeline:
                 meta={"frame": cycles, "done": True},
             )
         )
+        self.extend(new)
         return cursor
 
     def add_progress(
@@ -187,22 +275,18 @@ class Timeline:
         cursor = t_ms
 
         # Label line first
-        self._events.append(
+        new = [
             TimelineEvent(
                 t_ms=cursor,
                 event_type=EventType.LINE,
                 text=label,
                 style=LineStyle.DEFAULT,
             )
-        )
+        ]
         cursor += step_ms
 
-        for i in range(width + 1):
-            pct = i * 100 // width
-            filled = "█" * i
-            empty = "░" * (width - i)
-            bar_text = f"[{filled}{empty}] {pct:3d}%"
-            self._events.append(
+        for i, (bar_text, pct) in enumerate(_progress_bars(width)):
+            new.append(
                 TimelineEvent(
                     t_ms=cursor,
                     event_type=EventType.PROGRESS_FRAME,
@@ -214,11 +298,12 @@ class Timeline:
             )
             cursor += step_ms
 
+        self.extend(new)
         return cursor
 
     def add_pause(self, t_ms: float, duration_ms: float) -> float:
         """Add a pause event."""
-        self._events.append(
+        self.add(
             TimelineEvent(
                 t_ms=t_ms,
                 event_type=EventType.PAUSE,
@@ -231,7 +316,7 @@ class Timeline:
         self, t_ms: float, style: str = "cut", duration_ms: float = 200.0
     ) -> float:
         """Add a transition event."""
-        self._events.append(
+        self.add(
             TimelineEvent(
                 t_ms=t_ms,
                 event_type=EventType.TRANSITION,
@@ -242,35 +327,77 @@ class Timeline:
         )
         return t_ms + duration_ms
 
+    def copy(self) -> Timeline:
+        """Independent copy; events (and their meta) are not shared."""
+        clone = Timeline()
+        clone._events = [
+            replace(e, meta=dict(e.meta)) if e.meta else replace(e)
+            for e in self._events
+        ]
+        clone.charset = set(self.charset)
+        clone._text_pool = dict(self._text_pool)
+        clone._times = array("d", self._times)
+        clone._is_sorted = self._is_sorted
+        clone._end_ms = self._end_ms
+        return clone
+
     def sort(self) -> None:
-        """Sort events by timestamp."""
-        self._events.sort(key=lambda e: e.t_ms)
+        """Sort events by timestamp; a no-op if they were added in order."""
+        if not self._is_sorted:
+            self._events.sort(key=_event_time)
+            self._times = array("d", map(_event_time, self._events))
+            self._is_sorted = True
+            self._events_view = None
 
     @property
-    def events(self) -> list[TimelineEvent]:
-        """Get all events in order."""
-        return list(self._events)
+    def events(self) -> tuple[TimelineEvent, ...]:
+        """All events in order, as a read-only tuple.
+
+        The tuple is cached until events are added or reordered; use
+        ``list(timeline.events)`` for a mutable copy.
+        """
+        view = self._events_view
+        if view is None:
+            view = self._events_view = tuple(self._events)
+        return view
 
     @property
     def duration_ms(self) -> float:
         """Total timeline duration."""
-        if not self._events:
-            return 0.0
-        last = max(e.t_ms + e.duration_ms for e in self._events)
-        return last
+        return 0.0 if self._end_ms is None else self._end_ms
 
     def events_in_range(self, start_ms: float, end_ms: float) -> list[TimelineEvent]:
-        """Get events within a time range."""
-        return [e for e in self._events if start_ms <= e.t_ms < end_ms]
+        """Get events within a time range.
+
+        Sorted timelines (the usual case) are searched by bisection;
+        otherwise every event is checked.
+        """
+        events = self._events
+        if not self._is_sorted:
+            return [e for e in events if start_ms <= e.t_ms < end_ms]
+        times = self._times
+        lo = bisect_left(times, start_ms)
+        hi = bisect_left(times, end_ms, lo=lo)
+        return events[lo:hi]
 
     def apply_speed(self, multiplier: float) -> None:
         """Scale all timestamps by a speed multiplier."""
-        if multiplier <= 0:
+        if multiplier <= 0 or multiplier == 1.0 or not self._events:
             return
         factor = 1.0 / multiplier
-        for event in self._events:
-            event.t_ms *= factor
-            event.duration_ms *= factor
+        end_ms = float("-inf")
+        times = self._times
+        events = self._events
+        # Single fused pass: rescale each event, its time column entry, and
+        # track the new end time
+        for i, event in enumerate(events):
+            t = times[i] = event.t_ms * factor
+            d = event.duration_ms * factor
+            events[i] = replace(event, t_ms=t, duration_ms=d)
+            if t + d > end_ms:
+                end_ms = t + d
+        self._end_ms = end_ms
+        self._events_view = None
 
     def __len__(self) -> int:
         return len(self._events)
@@ -26,11 +26,10 @@ from PIL import Image, ImageDraw
 
 def build_scanline(width: int, height: int, output: Path) -> None:
     """Generate a CRT scanline overlay."""
-    img = Image.new("RGBA", (width, height), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
-
-    for y in range(0, height, 3):
-        draw.line([(0, y), (width, y)], fill=(0, 0, 0, 30))
+    # A 3-row period (one dark row, two clear ones) tiled down the image
+    period = bytes((0, 0, 0, 30)) * width + bytes(8 * width)
+    data = (period * (height // 3 + 1))[: width * height * 4]
+    img = Image.frombuffer("RGBA", (width, height), data, "raw", "RGBA", 0, 1)
 
     output.parent.mkdir(parents=True, exist_ok=True)
     img.save(str(output))
@@ -44,6 +43,9 @@ def build_vignette(width: int, height: int, output: Path) -> None:
 
     cx, cy = width // 2, height // 2
     steps = 50
+    # 50 filled ellipses are 50 C-level fills (a few ms at 1080p); a
+    # per-pixel radial formula would be slower without NumPy, and the
+    # PNG encode dominates either way
     for i in range(steps, 0, -1):
         frac = i / steps
         brightness = int(255 * frac)
@@ -56,11 +58,16 @@ def build_vignette(width: int, height: int, output: Path) -> None:
     print(f"  ✓ vignette: {output}")
 
 
+# Maps a uniform random byte onto the 100-156 noise band
+_NOISE_LEVELS = bytes(100 + b * 57 // 256 for b in range(256))
+
+
 def build_noise(width: int, height: int, output: Path) -> None:
     """Generate a noise texture."""
     rng = random.Random(42)
-    data = bytes(rng.randint(100, 156) for _ in range(width * height))
-    img = Image.frombytes("L", (width, height), data)
+    # One bulk draw remapped in C, rather than a randint call per pixel
+    data = rng.randbytes(width * height).translate(_NOISE_LEVELS)
+    img = Image.frombuffer("L", (width, height), data, "raw", "L", 0, 1)
 
     output.parent.mkdir(parents=True, exist_ok=True)
     img.save(str(output))
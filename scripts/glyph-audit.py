@@ -10,6 +10,7 @@ Usage:
 
 import argparse
 import sys
+from itertools import chain
 from pathlib import Path
 
 project_root = Path(__file__).resolve().parent.parent
@@ -21,6 +22,8 @@ from demo_engine.fonts import audit_glyphs, resolve_font_stack
 from demo_engine.themes import load_theme, list_themes
 from demo_engine.scenes import load_scene, list_scenes
 
+DEMO_CHARS = "❯✓✔✗█░━╗╔╚╝║╠╣╦╩╬⠋⠙⠹⠸⠼⠴⠦⠧⠇⠏"
+
 
 def main() -> int:
     parser = argparse.ArgumentParser(description="Glyph coverage audit")
@@ -50,10 +53,10 @@ def main() -> int:
             has_issues = True
             continue
 
-        # Collect all glyph map characters
-        corpus = "".join(theme.glyph_map.keys()) + "".join(theme.glyph_map.values())
-        # Add common terminal characters used in demos
-        corpus += "❯✓✔✗█░━╗╔╚╝║╠╣╦╩╬⠋⠙⠹⠸⠼⠴⠦⠧⠇⠏"
+        # Glyph map characters plus common terminal characters used in demos
+        corpus = "".join(
+            chain(theme.glyph_map.keys(), theme.glyph_map.values(), (DEMO_CHARS,))
+        )
 
         result = audit_glyphs(corpus, font_stack, theme.glyph_map)
         status = "✓" if result.is_clean else "⚠"
@@ -77,10 +80,9 @@ def main() -> int:
             has_issues = True
             continue
 
-        corpus = ""
-        for step in scene.steps:
-            corpus += step.text + step.label
-            corpus += "".join(step.output)
+        corpus = "".join(chain.from_iterable(
+            (step.text, step.label, *step.output) for step in scene.steps
+        ))
 
         if not corpus.strip():
             print(f"  - {scene_name}: (no text)")
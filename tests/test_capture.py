@@ -0,0 +1,99 @@
+"""Tests for asciicast capture parsing and timeline conversion."""
+
+import json
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from demo_engine.capture import asciicast_to_timeline, parse_asciicast
+from demo_engine.timeline import EventType
+
+
+def _write_cast(lines: list[str]) -> Path:
+    """Write raw asciicast lines to a temp file."""
+    tmp = tempfile.NamedTemporaryFile(
+        "w", suffix=".cast", delete=False, encoding="utf-8"
+    )
+    tmp.write("\n".join(lines) + "\n")
+    tmp.close()
+    return Path(tmp.name)
+
+
+HEADER = json.dumps({"version": 2, "width": 40, "height": 10})
+
+
+class TestParseAsciicast:
+    def test_basic_events(self):
+        path = _write_cast([
+            HEADER,
+            json.dumps([0.1, "o", "hello"]),
+            json.dumps([0.2, "o", " world\r\n"]),
+        ])
+        header, events = parse_asciicast(path)
+        assert header["width"] == 40
+        assert events == [(0.1, "o", "hello"), (0.2, "o", " world\r\n")]
+
+    def test_malformed_line_skipped(self):
+        path = _write_cast([
+            HEADER,
+            json.dumps([0.1, "o", "a"]),
+            "[0.2, \"o\", broken",
+            json.dumps([0.3, "o", "b"]),
+        ])
+        _, events = parse_asciicast(path)
+        assert [e[2] for e in events] == ["a", "b"]
+
+    def test_empty_file_raises(self):
+        path = _write_cast(["", ""])
+        with pytest.raises(ValueError, match="Empty asciicast"):
+            parse_asciicast(path)
+
+    def test_unsupported_version(self):
+        path = _write_cast([json.dumps({"version": 1})])
+        with pytest.raises(ValueError, match="Unsupported asciicast version"):
+            parse_asciicast(path)
+
+
+class TestAsciicastToTimeline:
+    def test_output_events_become_lines(self):
+        path = _write_cast([
+            HEADER,
+            json.dumps([0.1, "o", "$ ls\r\n"]),
+            json.dumps([0.5, "i", "ignored"]),
+            json.dumps([1.0, "o", "file.txt\r\n"]),
+        ])
+        timeline = asciicast_to_timeline(path)
+        events = timeline.events
+        assert events
+        assert all(e.event_type == EventType.LINE for e in events)
+        assert events[-1].text == "$ ls\nfile.txt"
+
+    def test_burst_coalesced_into_one_snapshot(self):
+        path = _write_cast([HEADER] + [
+            json.dumps([0.001 * i, "o", ch]) for i, ch in enumerate("typing", 1)
+        ])
+        timeline = asciicast_to_timeline(path, fps=30)
+        assert len(timeline) == 1
+        assert timeline.events[0].text == "typing"
+
+    def test_spaced_events_snapshotted_separately(self):
+        path = _write_cast([
+            HEADER,
+            json.dumps([0.1, "o", "a"]),
+            json.dumps([0.5, "o", "b"]),
+        ])
+        timeline = asciicast_to_timeline(path, fps=30)
+        assert [e.text for e in timeline.events] == ["a", "ab"]
+
+    def test_batches_follow_frame_boundaries(self):
+        # 30ms is shown alone on frame 1 (33.3ms); 40ms first appears on frame 2
+        path = _write_cast([
+            HEADER,
+            json.dumps([0.030, "o", "a"]),
+            json.dumps([0.040, "o", "b"]),
+            json.dumps([0.060, "o", "c"]),
+        ])
+        timeline = asciicast_to_timeline(path, fps=30)
+        assert [e.text for e in timeline.events] == ["a", "abc"]
+        assert [round(e.t_ms) for e in timeline.events] == [30, 60]
@@ -0,0 +1,96 @@
+"""Tests for the visual effects pipeline."""
+
+import pytest
+from PIL import Image, ImageChops, ImageStat
+
+from demo_engine.effects import (
+    EffectsConfig,
+    apply_effects,
+    _apply_noise,
+    _apply_scanlines,
+    _apply_vignette,
+    _roll_x,
+)
+
+
+def _gray(w: int = 160, h: int = 120, level: int = 64) -> Image.Image:
+    return Image.new("RGB", (w, h), (level, level, level))
+
+
+class TestNoise:
+    def test_deterministic_per_seed(self):
+        a = _apply_noise(_gray(), 0.5, seed=7)
+        b = _apply_noise(_gray(), 0.5, seed=7)
+        c = _apply_noise(_gray(), 0.5, seed=8)
+        assert a.tobytes() == b.tobytes()
+        assert a.tobytes() != c.tobytes()
+
+    def test_grain_centred_on_mid_gray(self):
+        img = _gray(level=128)
+        out = _apply_noise(img, 0.5, seed=1)
+        stat = ImageStat.Stat(out)
+        assert stat.mean[0] == pytest.approx(128, abs=1.0)
+        # sigma 40 blended at 0.075 → ~3 levels of spread
+        assert 2.0 < stat.stddev[0] < 4.0
+
+    def test_zero_alpha_is_noop(self):
+        img = _gray()
+        assert _apply_noise(img, 0.0) is img
+
+
+class TestScanlines:
+    def test_darkens_every_third_row(self):
+        out = _apply_scanlines(_gray(level=200), 0.2)
+        # alpha 0.2 → line alpha 51 → 200 * (255 - 51) / 255
+        assert out.getpixel((10, 0))[0] == pytest.approx(160, abs=1)
+        assert out.getpixel((10, 1)) == (200, 200, 200)
+        assert out.getpixel((10, 3))[0] == out.getpixel((10, 0))[0]
+
+
+class TestVignette:
+    def test_darkens_corners_not_centre(self):
+        img = _gray(level=200)
+        out = _apply_vignette(img, 0.5)
+        centre = out.getpixel((80, 60))[0]
+        edge = out.getpixel((0, 60))[0]
+        corner = out.getpixel((0, 0))[0]
+        assert centre >= 198
+        assert corner < edge < centre
+
+
+class TestChromaticAberration:
+    @pytest.mark.parametrize("dx", [1, -3, 0, 165])
+    def test_roll_matches_offset(self, dx):
+        band = Image.effect_noise((160, 120), 60)
+        assert _roll_x(band, dx).tobytes() == ImageChops.offset(band, dx, 0).tobytes()
+
+
+class TestApplyEffects:
+    def test_no_effects_returns_input(self):
+        img = _gray()
+        assert apply_effects(img, EffectsConfig()) is img
+
+    def test_fused_shading_matches_sequential(self):
+        img = Image.effect_noise((160, 120), 60).convert("RGB")
+        config = EffectsConfig(crt=True, scanline_alpha=0.2, vignette_strength=0.4)
+        fused = apply_effects(img, config)
+        sequential = _apply_vignette(_apply_scanlines(img, 0.2), 0.4)
+        diff = ImageStat.Stat(ImageChops.difference(fused, sequential))
+        assert max(hi for _, hi in diff.extrema) <= 2
+
+    def test_input_frame_left_untouched(self):
+        img = Image.effect_noise((160, 120), 60).convert("RGB")
+        before = img.tobytes()
+        config = EffectsConfig(glitch_cuts=True, chromatic_aberration=0.5)
+        apply_effects(img, config, t_ms=0.0, frame_num=0)
+        assert img.tobytes() == before
+
+    def test_preserves_size_and_mode(self):
+        config = EffectsConfig(
+            crt=True, scanline_alpha=0.3, noise_alpha=0.2,
+            vignette_strength=0.5, glow_strength=0.4,
+            glitch_cuts=True, chromatic_aberration=0.5,
+        )
+        out = apply_effects(_gray(), config, t_ms=0.0, frame_num=0)
+        assert out.size == (160, 120)
+        assert out.mode == "RGB"
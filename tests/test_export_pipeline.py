@@ -11,6 +11,7 @@ from demo_engine.export import (
     ExportManifest,
     ExportResult,
     cut_frames,
+    export_all,
     export_cover,
     export_gif,
     export_mp4,
@@ -45,6 +46,51 @@ class TestGifExport:
             with pytest.raises(ValueError, match="No frames"):
                 export_gif([], Path(tmpdir) / "empty.gif")
 
+    def test_thin_stroke_keeps_its_colour(self):
+        frames = [Image.new("RGB", (64, 48), (20 + i, 20, 30)) for i in range(4)]
+        for x in range(64):
+            frames[3].putpixel((x, 10), (230, 40, 40))
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "stroke.gif"
+            export_gif(frames, path, fps=10, optimize=False)
+            with Image.open(path) as gif:
+                gif.seek(3)
+                r, g, b = gif.convert("RGB").getpixel((30, 10))
+            assert max(abs(r - 230), abs(g - 40), abs(b - 40)) <= 4
+
+    def test_colors_survive_quantize(self):
+        frames = _make_test_frames(10)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "palette.gif"
+            export_gif(frames, path, fps=10, optimize=False)
+            with Image.open(path) as gif:
+                gif.seek(7)
+                r, g, b = gif.convert("RGB").getpixel((5, 5))
+            assert max(abs(r - 175), abs(g - 50), abs(b - 100)) <= 4
+
+    def test_accepts_any_sequence(self):
+        frames = tuple(_make_test_frames(4))
+        with tempfile.TemporaryDirectory() as tmpdir:
+            result = export_gif(frames, Path(tmpdir) / "tuple.gif", fps=10)
+            assert result.duration_s == pytest.approx(0.4)
+
+    def test_unknown_encoder_raises(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with pytest.raises(ValueError, match="GIF encoder"):
+                export_gif(_make_test_frames(2), Path(tmpdir) / "x.gif", encoder="lzw")
+
+    @pytest.mark.skipif(
+        not shutil.which("ffmpeg"), reason="ffmpeg not available"
+    )
+    def test_ffmpeg_encoder(self):
+        frames = _make_test_frames(10)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "ffmpeg.gif"
+            result = export_gif(frames, path, fps=10, encoder="ffmpeg")
+            with Image.open(result.path) as gif:
+                assert gif.n_frames == 10
+                assert gif.size == (320, 240)
+
     def test_single_frame(self):
         frames = _make_test_frames(1)
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -76,6 +122,59 @@ class TestMp4Export:
                 result = export_mp4(frames, path)
                 assert result.path.exists()
 
+    def test_hw_quality_mapping(self):
+        from demo_engine.export import _h264_args
+
+        assert _h264_args("libx264", 18)[:4] == ["-c:v", "libx264", "-crf", "18"]
+        assert "-cq" in _h264_args("h264_nvenc", 18)
+        vt = _h264_args("h264_videotoolbox", 18)
+        assert vt[vt.index("-q:v") + 1] == "64"
+
+    @pytest.mark.skipif(
+        not shutil.which("ffmpeg"), reason="ffmpeg not available"
+    )
+    def test_unusable_hw_encoder_falls_back(self, monkeypatch):
+        import demo_engine.export as export
+
+        monkeypatch.setattr(export, "HW_H264_ENCODERS", ("no_such_encoder",))
+        monkeypatch.setattr(export, "_FAILED_ENCODERS", set())
+        monkeypatch.setattr(
+            export, "_available_encoders", lambda: frozenset({"no_such_encoder"})
+        )
+        frames = _make_test_frames(5)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            result = export_mp4(frames, Path(tmpdir) / "fallback.mp4")
+            assert result.path.exists()
+        assert "no_such_encoder" in export._FAILED_ENCODERS
+
+    def test_frames_stream_as_raw_rgb(self, monkeypatch):
+        import demo_engine.export as export
+
+        written = []
+
+        class FakeProc:
+            def __init__(self, cmd, **kwargs):
+                self.cmd = cmd
+                self.stdin = self
+
+            def write(self, data):
+                written.append(data)
+
+            def close(self):
+                pass
+
+            def wait(self, timeout=None):
+                return 0
+
+        monkeypatch.setattr(export.subprocess, "Popen", FakeProc)
+        held = Image.new("RGBA", (8, 4), (255, 0, 0, 255))
+        frames = [held, held, Image.new("RGB", (8, 4), (0, 0, 255))]
+        export._encode_video(frames, Path("unused.mp4"), 30, [])
+        assert len(written) == 3
+        assert written[0] is written[1]
+        assert written[0] == held.convert("RGB").tobytes()
+        assert written[2] == frames[2].tobytes()
+
 
 class TestWebmExport:
     @pytest.mark.skipif(
@@ -131,6 +230,18 @@ class TestCutFrames:
         cut = cut_frames(frames, 30, "15s")
         assert len(cut) == 450
 
+    def test_cut_is_view_matching_slice(self):
+        frames = _make_test_frames(300)
+        cut = cut_frames(frames, 30, "5s")
+        start = int(300 * 0.15)
+        expected = frames[start:start + 150]
+        assert list(cut) == expected
+        assert cut[0] is frames[start]
+        assert cut[-1] is expected[-1]
+        assert list(cut[10:20]) == expected[10:20]
+        with pytest.raises(IndexError):
+            cut[150]
+
 
 class TestOutputNaming:
     def test_default_name(self):
@@ -143,6 +254,10 @@ class TestOutputNaming:
         name = generate_output_name(config, "launch", "mp4")
         assert name == "launch-matrix-1x1-short.mp4"
 
+    def test_unknown_aspect_rejected(self):
+        with pytest.raises(ValueError, match="aspect"):
+            RenderConfig(aspect="4:3")
+
 
 class TestExportManifest:
     def test_manifest_summary(self):
@@ -154,3 +269,12 @@ class TestExportManifest:
         summary = manifest.summary()
         assert "GIF" in summary
         assert "1.0MB" in summary
+
+
+class TestExportAll:
+    def test_manifest_order(self, tmp_path):
+        config = RenderConfig(export="gif", outdir=tmp_path, preset="short")
+        manifest = export_all(_make_test_frames(6), config, "order")
+        assert [r.format for r in manifest.results] == ["gif", "png"]
+        assert all(r.path.exists() for r in manifest.results)
+
@@ -7,6 +7,8 @@ from demo_engine.fonts import (
     GlyphAuditResult,
     apply_glyph_map,
     audit_glyphs,
+    audit_glyphs_cached,
+    audit_glyphs_from_set,
     resolve_font_stack,
 )
 
@@ -33,6 +35,84 @@ class TestResolveFont:
         del FONT_PROFILES["bogus"]
 
 
+class TestFontListCache:
+    def test_fc_list_result_persists(self, tmp_path, monkeypatch):
+        import subprocess
+        from demo_engine import fonts
+
+        calls = []
+
+        def fake_run(cmd, **kwargs):
+            calls.append(cmd)
+            return subprocess.CompletedProcess(
+                cmd, 0, stdout="/fonts/Mono.ttf: Mono Family,Mono\n", stderr=""
+            )
+
+        monkeypatch.setattr(fonts, "FONT_LIST_CACHE", tmp_path / "fontlist.json")
+        (tmp_path / "fontconfig").mkdir()
+        monkeypatch.setattr(fonts, "FONTCONFIG_CACHE_DIRS", (tmp_path / "fontconfig",))
+        monkeypatch.setattr(fonts.shutil, "which", lambda name: __file__)
+        monkeypatch.setattr(fonts.subprocess, "run", fake_run)
+        try:
+            fonts.discover_system_fonts.cache_clear()
+            first = fonts.discover_system_fonts()
+            fonts.discover_system_fonts.cache_clear()
+            assert fonts.discover_system_fonts() == first
+            assert first == {"Mono Family": "/fonts/Mono.ttf", "Mono": "/fonts/Mono.ttf"}
+            assert len(calls) == 1
+        finally:
+            fonts.discover_system_fonts.cache_clear()
+
+    def test_font_list_refreshed_when_font_dir_changes(self, tmp_path, monkeypatch):
+        import os
+        import subprocess
+        from demo_engine import fonts
+
+        calls = []
+
+        def fake_run(cmd, **kwargs):
+            calls.append(cmd)
+            return subprocess.CompletedProcess(cmd, 0, stdout="", stderr="")
+
+        user_fonts = tmp_path / "fonts" / "mono"
+        user_fonts.mkdir(parents=True)
+        monkeypatch.setattr(fonts, "FONT_LIST_CACHE", tmp_path / "fontlist.json")
+        monkeypatch.setattr(fonts, "FONTCONFIG_CACHE_DIRS", ())
+        monkeypatch.setattr(fonts, "FONT_DIRS", (tmp_path / "fonts",))
+        monkeypatch.setattr(fonts.shutil, "which", lambda name: __file__)
+        monkeypatch.setattr(fonts.subprocess, "run", fake_run)
+        try:
+            fonts.discover_system_fonts.cache_clear()
+            fonts.discover_system_fonts()
+            # A font dropped into a nested directory without running fc-cache
+            (user_fonts / "New.ttf").write_bytes(b"")
+            os.utime(user_fonts, (1, 1))
+            fonts.discover_system_fonts.cache_clear()
+            fonts.discover_system_fonts()
+            assert len(calls) == 2
+        finally:
+            fonts.discover_system_fonts.cache_clear()
+
+    def test_fc_list_timeout_is_not_persisted(self, tmp_path, monkeypatch):
+        import subprocess
+        from demo_engine import fonts
+
+        def slow_run(cmd, **kwargs):
+            raise subprocess.TimeoutExpired(cmd, kwargs.get("timeout"))
+
+        monkeypatch.setattr(fonts, "FONT_LIST_CACHE", tmp_path / "fontlist.json")
+        monkeypatch.setattr(fonts, "FONTCONFIG_CACHE_DIRS", ())
+        monkeypatch.setattr(fonts, "FONT_DIRS", ())
+        monkeypatch.setattr(fonts.shutil, "which", lambda name: __file__)
+        monkeypatch.setattr(fonts.subprocess, "run", slow_run)
+        try:
+            fonts.discover_system_fonts.cache_clear()
+            assert fonts.discover_system_fonts() == {}
+            assert not (tmp_path / "fontlist.json").exists()
+        finally:
+            fonts.discover_system_fonts.cache_clear()
+
+
 class TestGlyphAudit:
     def test_ascii_fully_covered(self):
         stack = resolve_font_stack("nerd-safe", 16)
@@ -70,6 +150,27 @@ class TestGlyphAudit:
         assert "Missing" in report
 
 
+class TestGlyphAuditCache:
+    def test_result_round_trips_through_cache(self, tmp_path):
+        stack = resolve_font_stack("nerd-safe", 16)
+        first = audit_glyphs_cached("Hello 🚀", stack, {"🚀": ">>"}, tmp_path)
+        assert len(list((tmp_path / "glyph_audit").glob("*.json"))) == 1
+        second = audit_glyphs_cached("Hello 🚀", stack, {"🚀": ">>"}, tmp_path)
+        assert second == first
+
+    def test_key_depends_on_glyph_map(self, tmp_path):
+        stack = resolve_font_stack("nerd-safe", 16)
+        audit_glyphs_cached("🚀", stack, None, tmp_path)
+        audit_glyphs_cached("🚀", stack, {"🚀": ">>"}, tmp_path)
+        assert len(list((tmp_path / "glyph_audit").glob("*.json"))) == 2
+
+    def test_no_cache_dir_writes_nothing(self, tmp_path):
+        stack = resolve_font_stack("nerd-safe", 16)
+        result = audit_glyphs_cached("abc", stack, None, None)
+        assert result.total_chars == 3
+        assert not any(tmp_path.iterdir())
+
+
 class TestApplyGlyphMap:
     def test_basic_substitution(self):
         assert apply_glyph_map("✔ done", {"✔": "✓"}) == "✓ done"
@@ -83,3 +184,79 @@ class TestApplyGlyphMap:
 
     def test_empty_map(self):
         assert apply_glyph_map("hello", {}) == "hello"
+
+    def test_translation_table_matches_replace(self):
+        from demo_engine.fonts import glyph_translation
+
+        gmap = {"🚀": ">>", "✔": "✓", "✗": "x"}
+        table = glyph_translation(gmap)
+        text = "🚀 deploy ✔ ok ✗ fail"
+        assert apply_glyph_map(text, gmap, table) == apply_glyph_map(text, gmap)
+
+    def test_multi_codepoint_source_has_no_table(self):
+        from demo_engine.fonts import glyph_translation
+
+        assert glyph_translation({"✔️": "✓"}) is None
+
+
+class TestAuditFromSet:
+    def test_matches_corpus_audit(self):
+        from demo_engine.timeline import Timeline
+
+        timeline = Timeline()
+        timeline.add_line(0, "✓ done")
+        timeline.add_spinner(0, "load", ["⠋", "⠙"], cycles=2)
+        timeline.add_pause(0, 100)
+        corpus = "\n".join(e.text for e in timeline.events if e.text)
+        assert timeline.charset == set(corpus) - {"\n"}
+
+        stack = resolve_font_stack("nerd-safe", 16)
+        from_set = audit_glyphs_from_set(timeline.charset, stack)
+        assert from_set == audit_glyphs(corpus, stack)
+
+
+class TestCharMap:
+    MONO = "/usr/share/fonts/truetype/dejavu/DejaVuSansMono.ttf"
+    SANS = "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"
+
+    def test_map_agrees_with_probing(self):
+        from pathlib import Path
+        from PIL import ImageFont
+        from demo_engine.fonts import build_char_map
+
+        if not (Path(self.MONO).exists() and Path(self.SANS).exists()):
+            pytest.skip("DejaVu fonts not installed")
+        primary = ImageFont.truetype(self.MONO, 16)
+        fallback = ImageFont.truetype(self.SANS, 16)
+        char_map = build_char_map(self.MONO, [fallback], [self.SANS])
+        assert char_map is not None
+
+        mapped = FontStack(primary, self.MONO, [fallback], [self.SANS], 16,
+                           char_to_font=char_map)
+        probed = FontStack(primary, self.MONO, [fallback], [self.SANS], 16)
+        for ch in "A✓❯█━╗":
+            assert mapped.get_font_for_char(ch) is probed.get_font_for_char(ch), ch
+        # Probing mistakes the primary's tofu box for a glyph; the cmap doesn't
+        assert mapped.get_font_for_char("⠋") is fallback
+        assert mapped.get_font_for_char("🚀") is primary
+
+    def test_unreadable_cmap_disables_map(self):
+        from demo_engine.fonts import build_char_map
+
+        assert build_char_map("/nonexistent.ttf", [], []) is None
+
+    def test_audit_uses_cmap_coverage(self):
+        from pathlib import Path
+        from PIL import ImageFont
+        from demo_engine.fonts import stack_coverage
+
+        if not (Path(self.MONO).exists() and Path(self.SANS).exists()):
+            pytest.skip("DejaVu fonts not installed")
+        stack = FontStack(
+            ImageFont.truetype(self.MONO, 16), self.MONO,
+            [ImageFont.truetype(self.SANS, 16)], [self.SANS], 16,
+            covered_codepoints=stack_coverage([self.MONO, self.SANS]),
+        )
+        result = audit_glyphs_from_set("a⠋🚀", stack)
+        assert result.missing == ["🚀"]
+        assert audit_glyphs_from_set("a⠋🚀", stack, {"🚀": ">>"}).is_clean
@@ -0,0 +1,92 @@
+"""Tests for the frame renderer — text layout, line cache, frame output."""
+
+import shutil
+
+import pytest
+from PIL import Image, ImageDraw, ImageFont
+
+from demo_engine.config import RenderConfig
+from demo_engine.fonts import FontStack
+from demo_engine.renderer import FrameRenderer
+from demo_engine.themes import load_theme
+
+
+def _make_frames(n: int = 10, w: int = 320, h: int = 240) -> list[Image.Image]:
+    """Generate simple test frames."""
+    return [Image.new("RGB", (w, h), (i * 25 % 256, 50, 100)) for i in range(n)]
+
+
+class _RecordingDraw:
+    """Stands in for ImageDraw, recording where each string lands."""
+
+    def __init__(self, image: Image.Image):
+        self._draw = ImageDraw.Draw(image)
+        self.calls: list[tuple[int, str]] = []
+
+    def text(self, xy, text, **kwargs):
+        self.calls.append((xy[0], text))
+        self._draw.text(xy, text, **kwargs)
+
+
+class TestTextLayout:
+    def test_proportional_primary_keeps_columns(self):
+        font = ImageFont.load_default(16)
+        stack = FontStack(primary=font, primary_path="<default>", size=16)
+        renderer = FrameRenderer(RenderConfig(), load_theme("synthwave"), stack)
+        cell = renderer.layout.char_width
+        assert not renderer._primary_is_grid
+
+        banner = "┌─┐ i │"
+        draw = _RecordingDraw(Image.new("RGB", (200, 40)))
+        renderer._draw_text_with_fallback(draw, 10, 0, banner, "#ffffff", font)
+
+        expected = [
+            (10 + col * cell, char) for col, char in enumerate(banner) if char != " "
+        ]
+        assert draw.calls == expected
+
+    def test_advance_never_below_one_cell(self):
+        from demo_engine.renderer import _advance
+
+        font = ImageFont.load_default(16)
+        assert _advance(font, "i", 9) == 9
+        assert _advance(font, "M", 9) == int(font.getlength("M"))
+
+
+class TestLineCache:
+    def test_cache_is_bounded_lru(self, monkeypatch):
+        from demo_engine import renderer as renderer_mod
+        from demo_engine.timeline import LineStyle
+
+        monkeypatch.setattr(renderer_mod, "LINE_CACHE_SIZE", 3)
+        renderer = renderer_mod.FrameRenderer(RenderConfig(), load_theme("synthwave"))
+        for text in ("a", "b", "c"):
+            renderer._line_strip(text, LineStyle.DEFAULT)
+        renderer._line_strip("a", LineStyle.DEFAULT)  # now most recent
+        renderer._line_strip("d", LineStyle.DEFAULT)
+        assert [k[0] for k in renderer._line_cache] == ["c", "a", "d"]
+
+
+class TestSaveFrames:
+    def test_identical_frames_are_linked(self, tmp_path):
+        renderer = FrameRenderer(RenderConfig(), load_theme("synthwave"))
+        frames = _make_frames(3)
+        held = [frames[0], frames[0], frames[0].copy(), frames[1], frames[2]]
+        paths = renderer.save_frames(held, tmp_path)
+
+        assert [p.name for p in paths] == [f"frame_{i:06d}.png" for i in range(5)]
+        assert paths[1].read_bytes() == paths[0].read_bytes()
+        assert paths[2].read_bytes() == paths[0].read_bytes()
+        for frame, path in zip(held, paths):
+            with Image.open(path) as saved:
+                assert saved.tobytes() == frame.tobytes()
+
+    @pytest.mark.skipif(
+        not shutil.which("ffmpeg"), reason="ffmpeg not available"
+    )
+    def test_encode_to_video(self, tmp_path):
+        renderer = FrameRenderer(RenderConfig(), load_theme("synthwave"))
+        result = renderer.encode_to_video(_make_frames(10), tmp_path / "out.mp4")
+        assert result.path.exists()
+        assert result.format == "mp4"
+        assert not list(tmp_path.glob("*.png"))
@@ -0,0 +1,126 @@
+"""Tests for scene loading and compilation."""
+
+import pytest
+
+from demo_engine.config import RenderConfig
+from demo_engine.scenes import (
+    _COMPILE_CACHE,
+    clear_compile_cache,
+    compile_scene,
+    generate_default_scene,
+    load_scene,
+)
+from demo_engine.timeline import EventType, LineStyle, Timeline, TimelineEvent
+
+
+SCENE_YAML = """\
+id: sample
+title: "Sample"
+steps:
+  - type: line
+    text: "hello"
+    style: success
+  - type: command
+    text: "ls"
+    output: ["a", "b"]
+"""
+
+
+class TestLoadScene:
+    def test_loads_steps(self, tmp_path):
+        path = tmp_path / "sample.yaml"
+        path.write_text(SCENE_YAML)
+        scene = load_scene(str(path))
+        assert scene.id == "sample"
+        assert [s.step_type for s in scene.steps] == ["line", "command"]
+        assert scene.steps[0].line_style is LineStyle.SUCCESS
+        assert scene.steps[1].output == ["a", "b"]
+
+    def test_style_edits_are_seen_by_compile(self, tmp_path):
+        path = tmp_path / "sample.yaml"
+        path.write_text(SCENE_YAML)
+        scene = load_scene(str(path))
+        scene.steps[0].style = "error"
+        timeline = compile_scene(scene, RenderConfig(preset="short"))
+        assert [e.style for e in timeline if e.text == "hello"] == [LineStyle.ERROR]
+
+    def test_unknown_sections_are_not_constructed(self, tmp_path):
+        # A tag the safe loader rejects only fails if the section is built
+        path = tmp_path / "extra.yaml"
+        path.write_text(SCENE_YAML + "notes: !!python/object:os.getcwd {}\n")
+        scene = load_scene(str(path))
+        assert len(scene.steps) == 2
+
+    def test_non_mapping_raises(self, tmp_path):
+        path = tmp_path / "list.yaml"
+        path.write_text("- a\n- b\n")
+        with pytest.raises(ValueError, match="mapping"):
+            load_scene(str(path))
+
+    def test_returns_independent_copies(self, tmp_path):
+        path = tmp_path / "sample.yaml"
+        path.write_text(SCENE_YAML)
+        first = load_scene(str(path))
+        first.steps.clear()
+        assert len(load_scene(str(path)).steps) == 2
+
+
+class TestCompileScene:
+    def test_memoized_result_is_a_copy(self):
+        clear_compile_cache()
+        config = RenderConfig(preset="short")
+        scene = generate_default_scene(config)
+        first = compile_scene(scene, config)
+        first.apply_speed(2.0)
+        second = compile_scene(scene, config)
+        assert len(_COMPILE_CACHE) == 1
+        assert second.events[-1].t_ms > first.events[-1].t_ms
+
+    def test_scene_edits_miss_the_cache(self):
+        clear_compile_cache()
+        config = RenderConfig(preset="short")
+        scene = generate_default_scene(config)
+        before = len(compile_scene(scene, config))
+        scene.steps.pop()
+        assert len(compile_scene(scene, config)) == before - 1
+
+    def test_events_are_emitted_in_order(self):
+        config = RenderConfig(preset="short")
+        timeline = compile_scene(generate_default_scene(config), config)
+        assert timeline._is_sorted
+        times = [e.t_ms for e in timeline]
+        assert times == sorted(times)
+
+    def test_out_of_order_add_is_sorted(self):
+        timeline = Timeline()
+        timeline.add(TimelineEvent(t_ms=50.0, event_type=EventType.LINE, text="b"))
+        timeline.add(TimelineEvent(t_ms=10.0, event_type=EventType.LINE, text="a"))
+        timeline.sort()
+        assert [e.text for e in timeline] == ["a", "b"]
+
+    def test_events_in_range(self):
+        timeline = Timeline()
+        for t in (0.0, 10.0, 10.0, 20.0, 30.0):
+            timeline.add(TimelineEvent(t_ms=t, event_type=EventType.PAUSE))
+        assert [e.t_ms for e in timeline.events_in_range(10.0, 30.0)] == [10.0, 10.0, 20.0]
+        assert timeline.events_in_range(31.0, 40.0) == []
+
+    def test_events_in_range_after_sort_and_speed(self):
+        timeline = Timeline()
+        for t in (30.0, 0.0, 20.0, 10.0):
+            timeline.add(TimelineEvent(t_ms=t, event_type=EventType.PAUSE))
+        timeline.sort()
+        timeline.apply_speed(2.0)
+        assert [e.t_ms for e in timeline.events_in_range(5.0, 15.0)] == [5.0, 10.0]
+
+    def test_events_are_immutable_and_refreshed_by_speed(self):
+        import dataclasses
+
+        timeline = Timeline()
+        timeline.add_pause(100.0, 50.0)
+        before = timeline.events
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            before[0].t_ms = 0.0
+        timeline.apply_speed(2.0)
+        assert before[0].t_ms == 100.0
+        assert (timeline.events[0].t_ms, timeline.duration_ms) == (50.0, 75.0)
@@ -23,6 +23,12 @@ class TestStripAnsi:
     def test_256_color(self):
         assert strip_ansi("\033[38;5;196mtext\033[0m") == "text"
 
+    def test_private_mode_and_osc(self):
+        assert strip_ansi("\033[?25l\033]0;title\007text\033[?25h") == "text"
+
+    def test_lone_escape_kept(self):
+        assert strip_ansi("a\033b\033[") == "a\033b\033["
+
 
 class TestVisibleLen:
     def test_plain(self):
@@ -34,6 +40,10 @@ class TestVisibleLen:
     def test_empty(self):
         assert visible_len("") == 0
 
+    def test_matches_strip_ansi(self):
+        for text in ("\033]0;title\007ok", "a\033b\033[", "\033(B\033[1;32m✓\033[0m"):
+            assert visible_len(text) == len(strip_ansi(text))
+
 
 class TestTerminalParserBasic:
     def test_simple_text(self):
@@ -133,6 +143,13 @@ class TestAnsiHandling:
         snap = p.snapshot()
         assert snap.styled_lines[0].cells[0].bold is True
 
+    def test_reset_inside_sequence(self):
+        p = TerminalParser(rows=10, cols=40)
+        p.feed("\033[1;32ma\033[1;0;31mb")
+        cell = p.snapshot().styled_lines[0].cells[1]
+        assert cell.fg == "#cc0000"
+        assert cell.bold is False
+
     def test_cursor_movement(self):
         p = TerminalParser(rows=10, cols=40)
         p.feed("ABCDEF")
@@ -141,6 +158,37 @@ class TestAnsiHandling:
         snap = p.snapshot()
         assert snap.lines[0] == "ABCXYZ"
 
+    def test_private_mode_and_osc_are_invisible(self):
+        p = TerminalParser(rows=10, cols=40)
+        p.feed("\033[?25l\033]0;title\007hidden cursor\033[?25h")
+        snap = p.snapshot()
+        assert snap.lines[0] == "hidden cursor"
+
+    def test_long_run_wraps(self):
+        p = TerminalParser(rows=5, cols=10)
+        p.feed("\033[32m" + "x" * 25)
+        snap = p.snapshot()
+        assert snap.lines[:3] == ["x" * 10, "x" * 10, "x" * 5]
+        assert snap.styled_lines[2].cells[4].fg == "#00cc00"
+        assert (snap.cursor_row, snap.cursor_col) == (2, 5)
+
+    def test_exact_width_line_defers_wrap(self):
+        p = TerminalParser(rows=3, cols=10)
+        p.feed("[" + "#" * 8 + "]")
+        p.feed("\r[" + "=" * 8 + "]")
+        p.feed("\ndone")
+        snap = p.snapshot()
+        assert snap.lines == ["[========]", "done", ""]
+        assert p._scroll_count == 0
+
+    def test_identical_cells_are_shared(self):
+        p = TerminalParser(rows=5, cols=10)
+        p.feed("\033[31maa")
+        cells = p.snapshot().styled_lines[0].cells
+        assert cells[0] is cells[1]
+        assert cells[2] is cells[9]
+        assert cells[0] is not cells[2]
+
     def test_erase_line(self):
         p = TerminalParser(rows=10, cols=40)
         p.feed("Hello World")
@@ -158,6 +206,31 @@ class TestSnapshot:
         assert "world" in snap.to_text()
         assert snap.t_ms == 1000
 
+    def test_nonempty_text_skips_blank_rows(self):
+        p = TerminalParser(rows=5, cols=20)
+        p.feed("a\n\n  \nb")
+        snap = p.snapshot()
+        assert snap.nonempty_text == "a\nb"
+
+    def test_clean_rows_are_reused(self):
+        p = TerminalParser(rows=5, cols=20)
+        p.feed("static\n\rspin 1")
+        first = p.snapshot()
+        p.feed("\rspin 2")
+        second = p.snapshot()
+        assert second.styled_lines[0] is first.styled_lines[0]
+        assert first.lines[1] == "spin 1"
+        assert second.lines[1] == "spin 2"
+
+    def test_scroll_invalidates_shifted_rows(self):
+        p = TerminalParser(rows=3, cols=20)
+        p.feed("a\nb\nc")
+        p.snapshot()
+        p.feed("\nd")
+        snap = p.snapshot()
+        assert snap.lines == ["b", "c", "d"]
+        assert [line.to_plain() for line in snap.styled_lines] == snap.lines
+
     def test_cursor_position(self):
         p = TerminalParser(rows=10, cols=40)
         p.feed("abc")
@@ -1,6 +1,7 @@
 """Tests for theme loading, validation, and schema compliance."""
 
 import json
+import os
 import pytest
 import tempfile
 from pathlib import Path
@@ -132,6 +133,19 @@ class TestThemeRegistry:
             theme = load_theme(name)
             assert isinstance(theme.glyph_map, dict)
 
+    def test_loaded_themes_are_independent(self):
+        t1 = load_theme("synthwave")
+        t1.colors.bg = "#123456"
+        assert load_theme("synthwave").colors.bg != "#123456"
+
+    def test_listing_tracks_directory_changes(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            themes_dir = Path(tmpdir)
+            assert list_themes(themes_dir) == []
+            (themes_dir / "extra.json").write_text("{}")
+            os.utime(themes_dir, ns=(0, 1))
+            assert list_themes(themes_dir) == ["extra"]
+
 
 class TestThemeFile:
     def test_invalid_json_raises(self):